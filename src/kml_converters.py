@@ -4,26 +4,81 @@ Keyhole Markup Language (KML) converter classes.
 Contents:
     Public Classes:
         KMLTrajectoryConverter
+
+    Public functions:
+        round_kml_values
+        format_kml_timestamps
+        is_flag_set
 """
 #TODO: Add stylemap (in utils_kml)
 #TODO: Add camera classes to track missile trajectory
 
 # Import packages
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
 
 import simplekml
 
-from utils import get_constants
+from trajectories import TrajectoryArrays
 from utils_geo import km_to_meters
 from utils_kml import (
     add_kml_linestring,
     add_kml_model,
+    add_kml_track,
     create_kml_linestring_style,
 )
 
-# Get constants
-constants = get_constants()
+# Define constants
+KML_LATLON_DECIMALS = 7 # ~1 cm
+KML_ALT_DECIMALS = 2 # meters
+KML_ANGLE_DECIMALS = 4
+
+# Define functions
+def round_kml_values(values: np.ndarray, decimals: int) -> List[float]:
+    """Round array values (computed in float64) to a fixed number of
+    decimals and convert to Python floats, so that KML text does not carry
+    spurious digits from float32 storage (e.g., 729.6300048828125).
+
+    Arguments
+        values: array of values to write to KML
+        decimals: number of decimal places to keep
+
+    Returns
+        list of rounded Python floats
+    """
+    return np.round(np.asarray(values, dtype=np.float64), decimals).tolist()
+
+def format_kml_timestamps(times: Union[np.ndarray, Sequence[datetime]]) -> List[str]:
+    """Format times as KML timestamp strings (ISO 8601 to the second, UTC,
+    e.g. '2020-07-30T04:00:00Z') in one datetime64 array operation. All KML
+    timestamps are formatted here so that every timestamp in a document has
+    the same format.
+
+    Arguments
+        times: datetime64 array or sequence of datetimes (UTC)
+
+    Returns
+        list of KML-formatted timestamp strings
+    """
+    return np.char.add(
+        np.datetime_as_string(np.asarray(times, dtype='datetime64[us]'), unit='s'),
+        'Z',
+    ).tolist()
+
+def is_flag_set(value) -> bool:
+    """Return True only if value is a boolean True. Config values read from
+    Excel may be NaN (blank cell) or strings such as 'FALSE', which are truthy
+    but must not enable the option.
+
+    Arguments
+        value: parameter value (e.g., from parse_config)
+
+    Returns
+        True if value is a Python or NumPy boolean True, otherwise False
+    """
+    return isinstance(value, (bool, np.bool_)) and bool(value)
 
 # Define classes
 class KMLTrajectoryConverter():
@@ -31,24 +86,28 @@ class KMLTrajectoryConverter():
     
     Attributes
         params: dict of user-defined parameter values
-        trajectory_data: dict of missile position/orientation for each timestep
+        trajectory_data: TrajectoryArrays of missile position/orientation for
+            each timestep
 
     Methods
         create_kml_trajectory
-        compute_timespan_start_end_times
+        create_kml_track
+        compute_kml_timestamps
         compute_sim_start_end_times
+        compute_kml_values
     """
 
     def __init__(
         self,
         params: Dict,
-        trajectory_data: Optional[Dict] = None,
+        trajectory_data: Optional[TrajectoryArrays] = None,
     ) -> None:
         """Instantiate KMLTrajectoryConverter class.
         
         Arguments
             params: dict of user-defined parameter values
-            trajectory_data: dict of missile position/orientation for each timestep
+            trajectory_data: TrajectoryArrays of missile position/orientation
+                for each timestep
         """
         self.params = params
         self.trajectory_data = trajectory_data
@@ -57,94 +116,180 @@ class KMLTrajectoryConverter():
         self,
         kml_document: simplekml.Document,
     ) -> simplekml.Document:
-        """Create KML model and linestring objects for missile trajectory.
+        """Create KML objects for missile trajectory. By default, trajectory is
+        emitted as a single animated GxTrack (see create_kml_track); if
+        params['emit_per_step_models'] is boolean True (see is_flag_set), a
+        KML model and linestring object is created for every timestep instead.
         
         Arguments:
             kml: simplekml document in which to add KML trajectory data
 
         Returns:
+            simplekml document > missile folder > GxTrack element, or
             simplekml document > missile folder > timestep folders > 
             COLLADA model and linestring elements
         """
+        if not is_flag_set(self.params.get('emit_per_step_models')):
+            return self.create_kml_track(kml_document)
         linestring_style = create_kml_linestring_style(
             color=simplekml.Color.blanchedalmond,
             width=2,
         )
         kml_missile_folder = kml_document.newfolder(name=self.params['missile_name'])
-        for time_idx, position_dict in self.trajectory_data.items():
+        data = self.trajectory_data
+        # Bind loop invariants to locals (avoids repeated global/dict lookups)
+        collada_model_path = self.params['collada_model_path']
+        collada_model_scale = self.params['collada_model_scale']
+        kml_values = self.compute_kml_values()
+        lat_deg, lon_deg = kml_values['lat_deg'], kml_values['lon_deg']
+        alt_meters = kml_values['alt_meters']
+        bearing_deg, tilt_deg = kml_values['bearing_deg'], kml_values['tilt_deg']
+        roll_deg = kml_values['roll_deg']
+        # Format each timestamp once (timestep ends where the next one begins)
+        timestamps = self.compute_kml_timestamps()
+        sim_start_timestamp, sim_end_timestamp = format_kml_timestamps(
+            self.compute_sim_start_end_times()
+        )
+        timespan_begins = [sim_start_timestamp, *timestamps[1:]]
+        timespan_ends = [*timestamps[1:], sim_end_timestamp]
+        for time_idx, time_sec in enumerate(data.time_sec):
             kml_timestep_folder = kml_missile_folder.newfolder(
-                name=f'position at t={time_idx}'
-            )
-            timespan_begin, timespan_end = self.compute_timespan_start_end_times(
-                time_idx
+                name=f'position at t={time_sec}'
             )
+            timespan_begin = timespan_begins[time_idx]
             # Add 3D model
             add_kml_model(
                 kml_folder=kml_timestep_folder,
-                lat_deg=position_dict['lat_deg'],
-                lon_deg=position_dict['lon_deg'],
-                alt_meters=km_to_meters(position_dict['alt_km']),
-                collada_model_link=self.params['collada_model_path'],
-                heading_deg=position_dict['bearing_deg'],
-                tilt_deg=position_dict['tilt_deg'],
-                roll_deg=position_dict['roll_deg'],
-                x_scale=self.params['collada_model_scale'],
-                y_scale=self.params['collada_model_scale'],
-                z_scale=self.params['collada_model_scale'],
-                timespan_begin=timespan_begin.strftime(constants['KML_TIME_FORMAT']),
-                timespan_end=timespan_end.strftime(constants['KML_TIME_FORMAT']),
+                lat_deg=lat_deg[time_idx],
+                lon_deg=lon_deg[time_idx],
+                alt_meters=alt_meters[time_idx],
+                collada_model_link=collada_model_path,
+                heading_deg=bearing_deg[time_idx],
+                tilt_deg=tilt_deg[time_idx],
+                roll_deg=roll_deg[time_idx],
+                x_scale=collada_model_scale,
+                y_scale=collada_model_scale,
+                z_scale=collada_model_scale,
+                timespan_begin=timespan_begin,
+                timespan_end=timespan_ends[time_idx],
             )
             # Add linestring indicating trajectory over previous timestep
-            if time_idx != min(self.trajectory_data.keys()):
-                prev_time_idx = time_idx - self.params['timestep_sec']
-                prev_position_dict = self.trajectory_data[prev_time_idx]  
+            if time_idx != 0:
+                prev_time_idx = time_idx - 1
                 lon_lat_alt_list = [
                     (
-                        prev_position_dict['lon_deg'],
-                        prev_position_dict['lat_deg'],
-                        km_to_meters(prev_position_dict['alt_km'])
+                        lon_deg[prev_time_idx],
+                        lat_deg[prev_time_idx],
+                        alt_meters[prev_time_idx]
                      ),
                     (  
-                        position_dict['lon_deg'],
-                        position_dict['lat_deg'],
-                        km_to_meters(position_dict['alt_km'])
+                        lon_deg[time_idx],
+                        lat_deg[time_idx],
+                        alt_meters[time_idx]
                     ),
                 ]
                 add_kml_linestring(
                     kml_folder=kml_timestep_folder,
                     lon_lat_alt_list=lon_lat_alt_list,
                     style=linestring_style,
-                    timespan_begin=timespan_begin.strftime(constants['KML_TIME_FORMAT']),
+                    timespan_begin=timespan_begin,
                     timespan_end='',
                 )
         return kml_document
 
-    def compute_timespan_start_end_times(
+    def create_kml_track(
         self,
-        time_idx: float,
-    ) -> Tuple[datetime, datetime]:
-        """Calculate model and linestring start/end times.
-        
+        kml_document: simplekml.Document,
+    ) -> simplekml.Document:
+        """Create a single animated KML GxTrack (with COLLADA model) for missile
+        trajectory. Default output of create_kml_trajectory; much more compact
+        than creating a folder, model, and linestring for every timestep.
+        If params['sim_start_time_buffer_sec'] or
+        params['sim_end_time_buffer_sec'] is positive, the track starts at the
+        simulation start time (at the launchpoint) and ends at the simulation
+        end time (at the final position); see compute_sim_start_end_times.
+
         Arguments:
-            time_idx: float time index for trajectory data
+            kml_document: simplekml document in which to add KML trajectory data
 
         Returns:
-            tuple of datetime (timespan_start, timespan_end)
+            simplekml document > missile folder > GxTrack element
         """
-        sim_start_time, sim_end_time = self.compute_sim_start_end_times()
-        if time_idx == min(self.trajectory_data.keys()):
-            timespan_start = sim_start_time
-        else:
-            timespan_start = self.params['launch_time'] + timedelta(
-                seconds=time_idx
-            )
-        if time_idx == max(self.trajectory_data.keys()):
-            timespan_end = sim_end_time
-        else:
-            timespan_end = self.params['launch_time'] + timedelta(
-                seconds=(time_idx + self.params['timestep_sec'])
-            )
-        return timespan_start, timespan_end
+        kml_missile_folder = kml_document.newfolder(name=self.params['missile_name'])
+        kml_values = self.compute_kml_values()
+        lon_lat_alt_list = list(zip(
+            kml_values['lon_deg'], kml_values['lat_deg'], kml_values['alt_meters'],
+        ))
+        heading_tilt_roll_list = list(zip(
+            kml_values['bearing_deg'], kml_values['tilt_deg'], kml_values['roll_deg'],
+        ))
+        timestamps = self.compute_kml_timestamps()
+        # Hold missile at launchpoint/final position during the simulation
+        # start/end buffers (as the first/last per-step models do)
+        sim_start_timestamp, sim_end_timestamp = format_kml_timestamps(
+            self.compute_sim_start_end_times()
+        )
+        if self.params['sim_start_time_buffer_sec'] > 0:
+            lon_lat_alt_list.insert(0, lon_lat_alt_list[0])
+            heading_tilt_roll_list.insert(0, heading_tilt_roll_list[0])
+            timestamps.insert(0, sim_start_timestamp)
+        if self.params['sim_end_time_buffer_sec'] > 0:
+            lon_lat_alt_list.append(lon_lat_alt_list[-1])
+            heading_tilt_roll_list.append(heading_tilt_roll_list[-1])
+            timestamps.append(sim_end_timestamp)
+        add_kml_track(
+            kml_folder=kml_missile_folder,
+            lon_lat_alt_list=lon_lat_alt_list,
+            timestamp_list=timestamps,
+            style=create_kml_linestring_style(
+                color=simplekml.Color.blanchedalmond,
+                width=2,
+            ),
+            track_label=self.params['missile_name'],
+            heading_tilt_roll_list=heading_tilt_roll_list,
+            collada_model_link=self.params['collada_model_path'],
+            model_scale=self.params['collada_model_scale'],
+        )
+        return kml_document
+
+    def compute_kml_values(self) -> Dict[str, List[float]]:
+        """Convert position/orientation arrays in trajectory data to the
+        rounded values written to KML (see round_kml_values). Altitude is
+        converted from km to meters.
+
+        Returns:
+            dict of lat_deg, lon_deg, alt_meters, bearing_deg, tilt_deg, and
+            roll_deg lists (one value per timestep)
+        """
+        data = self.trajectory_data
+        return {
+            'lat_deg':round_kml_values(data.lat_deg, KML_LATLON_DECIMALS),
+            'lon_deg':round_kml_values(data.lon_deg, KML_LATLON_DECIMALS),
+            'alt_meters':round_kml_values(
+                km_to_meters(np.asarray(data.alt_km, dtype=np.float64)),
+                KML_ALT_DECIMALS,
+            ),
+            'bearing_deg':round_kml_values(data.bearing_deg, KML_ANGLE_DECIMALS),
+            'tilt_deg':round_kml_values(data.tilt_deg, KML_ANGLE_DECIMALS),
+            'roll_deg':round_kml_values(data.roll_deg, KML_ANGLE_DECIMALS),
+        }
+
+    def compute_kml_timestamps(self) -> List[str]:
+        """Format the time (launch time plus elapsed time) of every timestep
+        in trajectory data as a KML timestamp string (see
+        format_kml_timestamps). Timestamps are computed as one datetime64
+        array operation.
+
+        Returns:
+            list of KML-formatted timestamp strings
+        """
+        # Round to microseconds (as datetime.timedelta does) before truncating
+        elapsed_time_us = np.round(self.trajectory_data.time_sec * 1e6)
+        timestamps = (
+            np.datetime64(self.params['launch_time'], 'us')
+            + elapsed_time_us.astype('timedelta64[us]')
+        )
+        return format_kml_timestamps(timestamps)
 
     def compute_sim_start_end_times(self) -> Tuple[datetime, datetime]:
         """Calculate simulation start/end times.
@@ -157,7 +302,7 @@ class KMLTrajectoryConverter():
         )
         sim_end_time = self.params['launch_time'] + timedelta(
             seconds=(
-                max(self.trajectory_data.keys()) 
+                self.trajectory_data.time_sec[-1]
                 + self.params['sim_end_time_buffer_sec']
             )
         )
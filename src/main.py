@@ -1,6 +1,7 @@
 """Main execution for missile intercept model."""
 
 # Import packages
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 import os
 from typing import Dict
@@ -9,27 +10,52 @@ import pandas as pd
 
 import simplekml
 
-from missiles_ballistic import BallisticMissile
+from missiles_ballistic import BallisticMissile, BallisticMissileBatch
 from utils_kml import save_kmz
 
 # Define functions
 def main() -> None:
-    """Main execution for missile intercept model."""
+    """Main execution for missile intercept model. Groups are independent
+    (one KMZ file per group), so they are run in parallel processes."""
     config = parse_config('../config/config.xlsx')
-    for group, sim_params_dict in config.items():
-        kml = simplekml.Kml()
-        for sim, params in sim_params_dict.items():
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(run_group, config.keys(), config.values()))
+
+def run_group(
+    group: str,
+    sim_params_dict: Dict,
+    output_dir: str = '../kml',
+    attachment_dir: str = '../blender',
+) -> None:
+    """Build and launch all missiles in simulation group and save KMZ file.
+
+    Arguments
+        group: simulation group name (used as KMZ file name)
+        sim_params_dict: dict of {simulation:{param:value}} for group
+        output_dir: directory in which to save KMZ file
+        attachment_dir: directory containing COLLADA model attachment
+    """
+    kml = simplekml.Kml()
+    params_list = list(sim_params_dict.values())
+    if len({params['timestep_sec'] for params in params_list}) == 1:
+        # Build/launch all group missiles in vectorized calls
+        batch = BallisticMissileBatch(params_list)
+        batch.build()
+        batch.launch()
+        kml = batch.create_kml_trajectory(kml)
+    else:
+        for params in params_list:
             missile = BallisticMissile(params)
             missile.build()
             missile.launch()
             kml = missile.create_kml_trajectory(kml)
-        save_kmz(
-            kml=kml,
-            output_dir='../kml',
-            output_file_name=group,
-            attachment_dir='../blender',
-            attachment_files_list=['test_missile.dae'],
-        )
+    save_kmz(
+        kml=kml,
+        output_dir=output_dir,
+        output_file_name=group,
+        attachment_dir=attachment_dir,
+        attachment_files_list=['test_missile.dae'],
+    )
 
 def parse_config(path: str) -> Dict:
     """Parse config file to create nested dict {group:{simulation:{param:value}}}"""
@@ -39,21 +65,21 @@ def parse_config(path: str) -> Dict:
         or 'Dtype' in col or 'Description' in col
     ]
     config = config.drop(columns=drop_cols).set_index('Parameter').T
+    # Derived parameters are built column-wise (one pass per column)
+    config['LP_latlon_deg'] = list(zip(config['LP_lat_deg'], config['LP_lon_deg']))
+    config['AP_latlon_deg'] = list(zip(config['AP_lat_deg'], config['AP_lon_deg']))
+    config['collada_model_path'] = list(map(
+        os.path.join, config['collada_model_dir'], config['collada_model_file'],
+    ))
+    config['launch_time'] = pd.Series( # object dtype keeps datetime.datetime
+        map(datetime.combine, config['launch_date'], config['launch_time_UTC']),
+        index=config.index,
+        dtype=object,
+    )
+    # Group simulations (groups keep order of first appearance)
     nested_config = {}
-    for group in config['group_name'].unique():
-        group_config = config.loc[config['group_name'] == group].T.to_dict()
-        group_dict = {}
-        for sim, params in group_config.items():
-            params['LP_latlon_deg'] = (params['LP_lat_deg'], params['LP_lon_deg'])
-            params['AP_latlon_deg'] = (params['AP_lat_deg'], params['AP_lon_deg'])
-            params['collada_model_path'] = os.path.join(
-                params['collada_model_dir'], params['collada_model_file']
-            )
-            params['launch_time'] = datetime.combine(
-                params['launch_date'], params['launch_time_UTC'],
-            )
-            group_dict[sim] = params
-        nested_config[group] = {**group_dict}
+    for sim, params in config.to_dict('index').items():
+        nested_config.setdefault(params['group_name'], {})[sim] = params
     return nested_config
 
 if __name__ == '__main__':
@@ -7,14 +7,16 @@ Contents:
 """
 # Import packages
 from abc import ABC, abstractmethod
+import math
 from typing import Dict, Optional, Tuple
 
 import numpy as np
 
 from utils_geo import (
+    DEG_TO_RAD,
+    RAD_TO_DEG,
     calculate_great_circle_distance,
-    calculate_initial_bearing,
-    rad_to_deg,
+    calculate_initial_bearing_precomputed,
 )
 
 # Define classes
@@ -23,8 +25,8 @@ class Missile(ABC):
 
     Attributes:
         params: dict of user-defined parameter values
-        LP_latlon_deg: tuple of launchpoint (latitude, longitude) in degrees
-        AP_latlon_deg: tuple of aimpoint (latitude, longitude) in degrees
+        LP_latlon_deg: float64 array of launchpoint (latitude, longitude) in degrees
+        AP_latlon_deg: float64 array of aimpoint (latitude, longitude) in degrees
 
     Methods:
         build (abstract)
@@ -38,6 +40,7 @@ class Missile(ABC):
         compute_velocity
         compute_altitude_angle
     """
+    __slots__ = ('params', 'LP_latlon_deg', 'AP_latlon_deg', '_AP_trig')
 
     def __init__(self, params: Optional[Dict] = None) -> None:
         """Instantiate Missile class.
@@ -46,8 +49,13 @@ class Missile(ABC):
             params: dict of user-defined parameter values
         """
         self.params = params
-        self.LP_latlon_deg = params.get('LP_latlon_deg', None)
-        self.AP_latlon_deg = params.get('AP_latlon_deg', None)
+        self.LP_latlon_deg = None
+        self.AP_latlon_deg = None
+        self._AP_trig = None
+        if params.get('LP_latlon_deg', None) is not None:
+            self.set_launchpoint(params['LP_latlon_deg'])
+        if params.get('AP_latlon_deg', None) is not None:
+            self.set_aimpoint(params['AP_latlon_deg'])
 
     @abstractmethod
     def build(self) -> None:
@@ -79,20 +87,25 @@ class Missile(ABC):
         """
 
     def set_launchpoint(self, LP_latlon_deg: Tuple[float, float]) -> None:
-        """Set launchpoint latitude and longitude in decimal degrees.
+        """Set launchpoint latitude and longitude in decimal degrees (stored as
+        a contiguous float64 array).
 
         Arguments
             LP_latlon_deg: tuple of launchpoint (latitude, longitude) in degrees
         """
-        self.LP_latlon_deg = LP_latlon_deg
+        self.LP_latlon_deg = np.asarray(LP_latlon_deg, dtype=np.float64)
 
     def set_aimpoint(self, AP_latlon_deg: Tuple[float, float]) -> None:
-        """Set aimpoint latitude and longitude in decimal degrees.
+        """Set aimpoint latitude and longitude in decimal degrees (stored as
+        a contiguous float64 array).
 
         Arguments
             AP_latlon_deg: tuple of aimpoint (latitude, longitude) in degrees
         """
-        self.AP_latlon_deg = AP_latlon_deg
+        self.AP_latlon_deg = np.asarray(AP_latlon_deg, dtype=np.float64)
+        # Aimpoint is fixed, so cache its trig terms for bearing calculations
+        AP_lat_rad, AP_lon_rad = self.AP_latlon_deg * DEG_TO_RAD
+        self._AP_trig = (math.sin(AP_lat_rad), math.cos(AP_lat_rad), AP_lon_rad)
 
     def compute_distance_to_target(
         self,
@@ -106,9 +119,10 @@ class Missile(ABC):
         Returns:
             distance to target (km)
         """
+        AP_lat_deg, AP_lon_deg = self.AP_latlon_deg
         return calculate_great_circle_distance(
             position_latlon_deg[0], position_latlon_deg[1],
-            self.AP_latlon_deg[0], self.AP_latlon_deg[1],
+            AP_lat_deg, AP_lon_deg,
         )
 
     def compute_bearing(
@@ -116,7 +130,9 @@ class Missile(ABC):
         position_latlon_deg: Tuple[float, float],
     ) -> float:
         """Compute forward azimuth/initial bearing (degrees, clockwise from
-        North) from current position to aimpoint.
+        North) from current position to aimpoint. Latitude and longitude may
+        be arrays, in which case bearings for all positions are computed in a
+        single vectorized call.
     
         Arguments:
             position_latlon_deg: tuple of missile's latitude, longitude (degrees)
@@ -124,9 +140,8 @@ class Missile(ABC):
         Returns
             bearing from position to aimpoint (degrees, clockwise from North)
         """
-        return calculate_initial_bearing(
-            position_latlon_deg[0], position_latlon_deg[1],
-            self.AP_latlon_deg[0], self.AP_latlon_deg[1],
+        return calculate_initial_bearing_precomputed(
+            position_latlon_deg[0], position_latlon_deg[1], *self._AP_trig,
         )
 
     def compute_velocity(
@@ -144,9 +159,7 @@ class Missile(ABC):
         Returns:
             forward velocity (km/s)
         """
-        return np.sqrt(
-            horizontal_velocity_km_sec**2 + vertical_velocity_km_sec**2
-        )
+        return math.hypot(horizontal_velocity_km_sec, vertical_velocity_km_sec)
 
     def compute_altitude_angle(
         self,
@@ -163,6 +176,6 @@ class Missile(ABC):
         Returns:
             altitude angle (degrees)
         """
-        return rad_to_deg(np.arctan(
+        return math.atan(
             vertical_velocity_km_sec / horizontal_velocity_km_sec
-        ))
+        ) * RAD_TO_DEG
@@ -4,12 +4,14 @@ Ballistic missile classes.
 Contents:
     Public classes:
         BallisticMissile
+        BallisticMissileBatch
 """
 #TODO: check initial launch velocity less than Earth escape velocity
 
 # Import packages
-from collections import OrderedDict
-from typing import Dict, Optional
+from functools import lru_cache
+import math
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
 
 import numpy as np
 
@@ -17,15 +19,156 @@ import simplekml
 
 from kml_converters import KMLTrajectoryConverter
 from missiles_abstract import Missile
+from trajectories import TRAJECTORY_DTYPE, TrajectoryArrays
 from utils import get_constants
 from utils_geo import (
-    rad_to_deg,
+    DEG_TO_RAD,
+    RAD_TO_DEG,
+    calculate_great_circle_distance_and_bearing,
+    calculate_initial_bearing,
     determine_destination_coords,
-    convert_trig_to_compass_angle,
+    determine_destination_coords_precomputed,
 )
 
 # Get constants
 constants = get_constants()
+GRAVITY_ACCEL_KM_PER_S2 = constants['GRAVITY_ACCEL_KM_PER_S2']
+ABS_GRAVITY_ACCEL_KM_PER_S2 = abs(GRAVITY_ACCEL_KM_PER_S2)
+HALF_GRAVITY_ACCEL_KM_PER_S2 = 0.5 * GRAVITY_ACCEL_KM_PER_S2
+BUILD_CACHE_DECIMALS = 9
+STOPTIME_TOLERANCE_SEC = 1e-6 # round-off allowed when stoptime equals time to target
+
+# Define functions
+class _TrajectoryStatics(NamedTuple):
+    """Static characteristics of a ballistic missile (see BallisticMissile.build)."""
+    launchpoint_dist_to_target_km: float
+    launchpoint_bearing_deg: float
+    total_time_to_target_sec: float
+    horizontal_velocity_km_sec: float
+    initial_vertical_velocity_km_sec: float
+    initial_launch_velocity_km_sec: float
+    initial_launch_angle_deg: float
+    apex_time_sec: float
+    apex_alt_km: float
+
+@lru_cache(maxsize=4096)
+def _build_trajectory_statics(
+    LP_lat_deg: float, LP_lon_deg: float,
+    AP_lat_deg: float, AP_lon_deg: float,
+    horizontal_velocity_km_sec: float,
+) -> _TrajectoryStatics:
+    """Compute static characteristics of a ballistic missile. Pure function of
+    launch geometry and horizontal velocity, so results are memoized for
+    repeated evaluation (e.g., Monte Carlo or parameter sweeps).
+
+    Arguments
+        LP_lat_deg: launchpoint latitude in decimal degrees
+        LP_lon_deg: launchpoint longitude in decimal degrees
+        AP_lat_deg: aimpoint latitude in decimal degrees
+        AP_lon_deg: aimpoint longitude in decimal degrees
+        horizontal_velocity_km_sec: horizontal velocity (km/s)
+
+    Returns
+        _TrajectoryStatics named tuple
+    """
+    dist_to_target_km, bearing_deg = calculate_great_circle_distance_and_bearing(
+        LP_lat_deg, LP_lon_deg, AP_lat_deg, AP_lon_deg,
+    )
+    return _compute_trajectory_statics(
+        dist_to_target_km, bearing_deg, horizontal_velocity_km_sec,
+    )
+
+def _compute_trajectory_statics(
+    dist_to_target_km: Union[float, np.ndarray],
+    bearing_deg: Union[float, np.ndarray],
+    horizontal_velocity_km_sec: Union[float, np.ndarray],
+) -> _TrajectoryStatics:
+    """Compute static characteristics of ballistic missile(s) from distance
+    and bearing to target. Accepts scalars (BallisticMissile) or (M,) arrays
+    (BallisticMissileBatch); fields have the same shape as the inputs.
+
+    Arguments
+        dist_to_target_km: great-circle distance from launchpoint to aimpoint (km)
+        bearing_deg: initial bearing from launchpoint to aimpoint (degrees)
+        horizontal_velocity_km_sec: horizontal velocity (km/s)
+
+    Returns
+        _TrajectoryStatics named tuple
+    """
+    time_to_target_sec = dist_to_target_km / horizontal_velocity_km_sec
+    initial_vertical_velocity_km_sec = (
+        time_to_target_sec * 0.5 * ABS_GRAVITY_ACCEL_KM_PER_S2
+    )
+    return _TrajectoryStatics(
+        launchpoint_dist_to_target_km=dist_to_target_km,
+        launchpoint_bearing_deg=bearing_deg,
+        total_time_to_target_sec=time_to_target_sec,
+        horizontal_velocity_km_sec=horizontal_velocity_km_sec,
+        initial_vertical_velocity_km_sec=initial_vertical_velocity_km_sec,
+        initial_launch_velocity_km_sec=np.hypot(
+            horizontal_velocity_km_sec, initial_vertical_velocity_km_sec,
+        ),
+        initial_launch_angle_deg=np.arctan(
+            initial_vertical_velocity_km_sec / horizontal_velocity_km_sec
+        ) * RAD_TO_DEG,
+        # Symmetric ballistic flight: apex at half the time to target
+        apex_time_sec=0.5 * time_to_target_sec,
+        apex_alt_km=(
+            0.125 * ABS_GRAVITY_ACCEL_KM_PER_S2
+            * time_to_target_sec * time_to_target_sec
+        ),
+    )
+
+@lru_cache(maxsize=32)
+def _build_time_grid(stoptime_sec: float, timestep_sec: float) -> np.ndarray:
+    """Create elapsed-time grid (seconds) from launch until stoptime. Memoized
+    so that launches sharing the same stoptime and timestep (e.g., Monte Carlo
+    sweeps) reuse one array; the array is read-only because it is shared.
+    Times are integer multiples of timestep_sec (no floating-point step
+    accumulation), with the same number of timesteps as
+    BallisticMissileBatch.launch.
+
+    Arguments
+        stoptime_sec: last elapsed time (seconds)
+        timestep_sec: time between timesteps (seconds)
+
+    Returns
+        read-only float64 array of elapsed times (seconds)
+    """
+    n_timesteps = math.ceil((stoptime_sec + timestep_sec) / timestep_sec)
+    time_sec = np.arange(n_timesteps, dtype=np.float64) * timestep_sec
+    time_sec.setflags(write=False)
+    return time_sec
+
+def _compute_kml_tilt_deg(
+    vertical_velocity_km_sec: Union[float, np.ndarray],
+    horizontal_velocity_km_sec: Union[float, np.ndarray],
+) -> Union[float, np.ndarray]:
+    """Compute KML tilt (degrees), which is measured from vertical (90 degrees
+    minus pitch angle). Accepts scalars or broadcastable arrays.
+
+    Arguments
+        vertical_velocity_km_sec: current vertical velocity (km/s)
+        horizontal_velocity_km_sec: horizontal velocity (km/s)
+
+    Returns
+        tilt (degrees)
+    """
+    return 90 - np.arctan2(
+        vertical_velocity_km_sec, horizontal_velocity_km_sec,
+    ) * RAD_TO_DEG
+
+def _get_param_or_nan(
+    params: Dict,
+    key: str,
+    size: Optional[int] = None,
+) -> Union[float, Tuple[float, ...]]:
+    """Get parameter value, or NaN (a tuple of size NaNs if size is given)
+    if the parameter is missing or None."""
+    value = params.get(key)
+    if value is None:
+        return math.nan if size is None else (math.nan,) * size
+    return value
 
 # Define classes
 class BallisticMissile(Missile):
@@ -33,20 +176,24 @@ class BallisticMissile(Missile):
     
     Attributes:
         params: dict of user-defined parameter values
-        LP_latlon_deg: tuple of launchpoint (latitude, longitude) in degrees
-        AP_latlon_deg: tuple of aimpoint (latitutde, longitude) in degrees
+        LP_latlon_deg: float64 array of launchpoint (latitude, longitude) in degrees
+        AP_latlon_deg: float64 array of aimpoint (latitude, longitude) in degrees
         build_data: dict of static characteristics of ballistic missile
-        trajectory_data: dict of missile position/orientation for each timestep
+        trajectory_data: TrajectoryArrays of missile position/orientation for
+            each timestep
 
     Methods:
         build
         launch
+        set_launchpoint
+        set_aimpoint
         get_current_position
         get_current_orientation
-        compute_initial_vertical_velocity
         compute_current_vertical_velocity
         create_kml_trajectory
+        create_kml_track
     """
+    __slots__ = ('build_data', 'trajectory_data', '_destination_trig')
 
     def __init__(self, params: Dict) -> None:
         """Instantiate BallisticMissile.
@@ -55,8 +202,50 @@ class BallisticMissile(Missile):
             params: dict of user-defined parameter values
         """
         super(BallisticMissile, self).__init__(params)
+        self._reset_build()
+
+    def set_launchpoint(self, LP_latlon_deg: Tuple[float, float]) -> None:
+        """Set launchpoint latitude and longitude in decimal degrees and
+        discard any build/trajectory data computed for the previous launchpoint.
+
+        Arguments
+            LP_latlon_deg: tuple of launchpoint (latitude, longitude) in degrees
+        """
+        super(BallisticMissile, self).set_launchpoint(LP_latlon_deg)
+        self._reset_build()
+
+    def set_aimpoint(self, AP_latlon_deg: Tuple[float, float]) -> None:
+        """Set aimpoint latitude and longitude in decimal degrees and
+        discard any build/trajectory data computed for the previous aimpoint.
+
+        Arguments
+            AP_latlon_deg: tuple of aimpoint (latitude, longitude) in degrees
+        """
+        super(BallisticMissile, self).set_aimpoint(AP_latlon_deg)
+        self._reset_build()
+
+    def _reset_build(self) -> None:
+        """Invalidate build and trajectory data (must call build() again)."""
         self.build_data = None
         self.trajectory_data = None
+        self._destination_trig = None
+
+    def _validate_inputs(self) -> None:
+        """Raise ValueError if inputs required by build() are missing or invalid."""
+        if self.LP_latlon_deg is None or not np.isfinite(self.LP_latlon_deg).all():
+            raise ValueError(
+                'Finite launchpoint required (set LP_latlon_deg or call '
+                f'set_launchpoint; got {self.LP_latlon_deg}).'
+            )
+        if self.AP_latlon_deg is None or not np.isfinite(self.AP_latlon_deg).all():
+            raise ValueError(
+                'Finite aimpoint required (set AP_latlon_deg or call '
+                f'set_aimpoint; got {self.AP_latlon_deg}).'
+            )
+        for key in ['horizontal_velocity_km_sec', 'timestep_sec']:
+            value = self.params.get(key)
+            if value is None or not (np.isfinite(value) and value > 0):
+                raise ValueError(f'Positive, finite {key} required (got {value}).')
 
     def build(self) -> None:
         """Compute static characteristics of ballistic missile:
@@ -67,57 +256,83 @@ class BallisticMissile(Missile):
             - Initial vertical velocity (km/s)
             - Initial launch velocity (km/s)
             - Initial launch angle (degrees)
+            - Time to apex (seconds)
+            - Apex altitude (km)
+        Coordinates are rounded to BUILD_CACHE_DECIMALS so that nominally
+        identical launch geometries share a cached result.
         """
-        dist_to_target_km = self.compute_distance_to_target(self.LP_latlon_deg)
-        time_to_target_sec = (
-            dist_to_target_km / self.params['horizontal_velocity_km_sec']
-        )
-        initial_vertical_velocity_km_sec = self.compute_initial_vertical_velocity(
-            time_to_target_sec
-        )
-        initial_launch_velocity_km_sec = self.compute_velocity(
+        self._validate_inputs()
+        LP_lat_deg, LP_lon_deg = np.round(self.LP_latlon_deg, BUILD_CACHE_DECIMALS)
+        AP_lat_deg, AP_lon_deg = np.round(self.AP_latlon_deg, BUILD_CACHE_DECIMALS)
+        self.build_data = _build_trajectory_statics(
+            float(LP_lat_deg), float(LP_lon_deg),
+            float(AP_lat_deg), float(AP_lon_deg),
             self.params['horizontal_velocity_km_sec'],
-            initial_vertical_velocity_km_sec,
+        )._asdict()
+        # Launchpoint and bearing are fixed for the whole trajectory (use the
+        # same rounded launchpoint from which the bearing was computed)
+        LP_lat_rad = float(LP_lat_deg) * DEG_TO_RAD
+        LP_lon_rad = float(LP_lon_deg) * DEG_TO_RAD
+        bearing_rad = self.build_data['launchpoint_bearing_deg'] * DEG_TO_RAD
+        self._destination_trig = (
+            math.sin(LP_lat_rad), math.cos(LP_lat_rad), LP_lon_rad,
+            math.sin(bearing_rad), math.cos(bearing_rad),
         )
-        initial_launch_angle_deg = self.compute_altitude_angle(
-            self.params['horizontal_velocity_km_sec'],
-            initial_vertical_velocity_km_sec,
-        )
-        self.build_data = {
-            'launchpoint_dist_to_target_km':dist_to_target_km,
-            'launchpoint_bearing_deg':self.compute_bearing(self.LP_latlon_deg),
-            'total_time_to_target_sec':time_to_target_sec,
-            'horizontal_velocity_km_sec':self.params['horizontal_velocity_km_sec'],
-            'initial_vertical_velocity_km_sec':initial_vertical_velocity_km_sec,
-            'initial_launch_velocity_km_sec':initial_launch_velocity_km_sec,
-            'initial_launch_angle_deg':initial_launch_angle_deg,
-        }
 
-    def launch(self, stoptime_sec: Optional[float] = None) -> None:
+    def launch(
+        self,
+        stoptime_sec: Optional[float] = None,
+        dtype: np.dtype = TRAJECTORY_DTYPE,
+    ) -> None:
         """Record missile position (latitude, longitude, altitude) and orientation
         (heading, tilt, and roll) for each timestep from launch until impact.
         
         Arguments
             stoptime_sec: maximum time (seconds) for which to calculate missile
                 position and orientation; if None (default), use total time to 
-                target
+                target (must not exceed total time to target by more than
+                STOPTIME_TOLERANCE_SEC; clamped to total time to target)
+            dtype: dtype of stored altitude/orientation arrays (computation is
+                always done in float64; latitude/longitude are stored as float64)
         """
-        traj_dict = OrderedDict()
+        if self.build_data is None:
+            raise RuntimeError('Missile must be built (call build()) before launch.')
+        total_time_to_target_sec = self.build_data['total_time_to_target_sec']
         if stoptime_sec is None:
-            stoptime_sec = self.build_data['total_time_to_target_sec']
-        for elapsed_time_sec in np.arange(
-            start=0,
-            stop=(stoptime_sec + self.params['timestep_sec']),
-            step=self.params['timestep_sec'],
-        ):
-            position_dict = self.get_current_position(elapsed_time_sec)
-            orientation_dict = self.get_current_orientation(elapsed_time_sec)
-            traj_dict[elapsed_time_sec] = {**position_dict, **orientation_dict}
-        self.trajectory_data = traj_dict
+            stoptime_sec = total_time_to_target_sec
+        elif stoptime_sec > total_time_to_target_sec + STOPTIME_TOLERANCE_SEC:
+            raise ValueError(
+                f'stoptime_sec ({stoptime_sec}) exceeds total time to target '
+                f'({total_time_to_target_sec:.2f} seconds).'
+            )
+        else:
+            stoptime_sec = min(stoptime_sec, total_time_to_target_sec)
+        time_sec = _build_time_grid(stoptime_sec, self.params['timestep_sec'])
+        # Compute position and orientation for all timesteps as arrays
+        position_dict = self.get_current_position(time_sec)
+        arrays = {
+            'lat_deg':np.asarray(position_dict['lat_deg'], dtype=np.float64),
+            'lon_deg':np.asarray(position_dict['lon_deg'], dtype=np.float64),
+            'alt_km':np.asarray(position_dict['alt_km'], dtype=dtype),
+        }
+        orientation_dict = self.get_current_orientation(time_sec, position_dict)
+        arrays['bearing_deg'] = np.asarray(orientation_dict['bearing_deg'], dtype=dtype)
+        arrays['tilt_deg'] = np.asarray(orientation_dict['tilt_deg'], dtype=dtype)
+        arrays['roll_deg'] = np.full(
+            len(time_sec), orientation_dict['roll_deg'], dtype=dtype,
+        )
+        self.trajectory_data = TrajectoryArrays(
+            time_sec=time_sec, **arrays,
+        )
 
-    def get_current_position(self, elapsed_time_sec: float) -> Dict:
+    def get_current_position(
+        self,
+        elapsed_time_sec: Union[float, np.ndarray],
+    ) -> Dict:
         """Compute the current latitude/longitude (degrees) and altitude (km)
-        of missile based on elapsed time since launch (seconds).
+        of missile based on elapsed time since launch (seconds). Accepts a
+        scalar or an array of elapsed times (values in the returned dict have
+        the same shape as elapsed_time_sec).
 
         Arguments
             elapsed_time_sec: elapsed time since launch (seconds)
@@ -125,46 +340,55 @@ class BallisticMissile(Missile):
         Returns
             dict containing lat_deg, lon_deg, and alt_km
         """
-        dist_km = self.build_data['horizontal_velocity_km_sec'] * elapsed_time_sec
-        current_latlon_deg = determine_destination_coords(
-            origin_lat_deg=self.LP_latlon_deg[0],
-            origin_lon_deg=self.LP_latlon_deg[1],
-            distance_km=dist_km,
-            initial_bearing_deg=self.build_data['launchpoint_bearing_deg'],
-        )
-        # Integrate vertical velocity formula
-        current_altitude_km = ( 
-            self.build_data['initial_vertical_velocity_km_sec'] * elapsed_time_sec
-            + (0.5 * constants['GRAVITY_ACCEL_KM_PER_S2'] * elapsed_time_sec**2)
+        build_data = self.build_data
+        dist_km = build_data['horizontal_velocity_km_sec'] * elapsed_time_sec
+        current_lat_deg, current_lon_deg = determine_destination_coords_precomputed(
+            *self._destination_trig, distance_km=dist_km,
+        )
+        # Integrate vertical velocity formula (Horner form: t * (v0 + g*t/2))
+        current_altitude_km = elapsed_time_sec * (
+            build_data['initial_vertical_velocity_km_sec']
+            + HALF_GRAVITY_ACCEL_KM_PER_S2 * elapsed_time_sec
         )
+        # Clip to ground level (in place for arrays)
+        if isinstance(current_altitude_km, np.ndarray):
+            np.maximum(current_altitude_km, 0, out=current_altitude_km)
+        else:
+            current_altitude_km = max(current_altitude_km, 0.0)
         return {
-            'lat_deg':current_latlon_deg[0],
-            'lon_deg':current_latlon_deg[1],
-            'alt_km':max(current_altitude_km, 0),
+            'lat_deg':current_lat_deg,
+            'lon_deg':current_lon_deg,
+            'alt_km':current_altitude_km,
         }
 
-    def get_current_orientation(self, elapsed_time_sec: float) -> Dict:
+    def get_current_orientation(
+        self,
+        elapsed_time_sec: Union[float, np.ndarray],
+        current_position_dict: Optional[Dict] = None,
+    ) -> Dict:
         """Compute the heading, tilt, and roll (degrees) for current position
-        based on elapsed time since launch (seconds).
+        based on elapsed time since launch (seconds). Accepts a scalar or an
+        array of elapsed times (bearing and tilt have the same shape as
+        elapsed_time_sec).
         Note: For version 0.1.0, COLLADA missile representations are
         assumed to be symmetrical, and roll is always set to 0 degrees.
 
         Arguments
             elapsed_time_sec: elapsed time since launch (seconds)
+            current_position_dict: output of get_current_position for
+                elapsed_time_sec, if already computed (default None computes it)
 
         Returns
             dict containing bearing_deg, tilt_deg, and roll_deg
         """
-        position_dict = self.get_current_position(elapsed_time_sec)
+        position_dict = current_position_dict
+        if position_dict is None:
+            position_dict = self.get_current_position(elapsed_time_sec)
         position_latlon_deg = (position_dict['lat_deg'], position_dict['lon_deg'])
         current_bearing_deg = self.compute_bearing(position_latlon_deg)
-        current_tilt_deg = rad_to_deg(
-            convert_trig_to_compass_angle(
-                np.arctan2(
-                    self.compute_current_vertical_velocity(elapsed_time_sec),
-                    self.build_data['horizontal_velocity_km_sec'],
-                )
-            )
+        current_tilt_deg = _compute_kml_tilt_deg(
+            self.compute_current_vertical_velocity(elapsed_time_sec),
+            self.build_data['horizontal_velocity_km_sec'],
         )
         return {
             'bearing_deg':current_bearing_deg,
@@ -172,24 +396,12 @@ class BallisticMissile(Missile):
             'roll_deg':0,
         }
 
-    def compute_initial_vertical_velocity(self, time_to_target_sec: float) -> float:
-        """Compute initial vertical velocity (km/s) at time of launch as 
-        time-to-apogee (seconds) multiplied by gravitational acceleration (km/s^2).
-
-        Arguments:
-            time_to_target_sec: missile time-to-target (seconds)
-
-        Returns:
-            initial vertical velocity (km/s)
-        """
-        time_to_apogee_sec = time_to_target_sec * 0.5
-        initial_vertical_velocity_km_sec = (
-            time_to_apogee_sec * abs(constants['GRAVITY_ACCEL_KM_PER_S2'])
-        )
-        return initial_vertical_velocity_km_sec
-
-    def compute_current_vertical_velocity(self, elapsed_time_sec: float) -> float:
+    def compute_current_vertical_velocity(
+        self,
+        elapsed_time_sec: Union[float, np.ndarray],
+    ) -> Union[float, np.ndarray]:
         """Compute vertical velocity (km/s) given time since launch (seconds).
+        Accepts a scalar or an array of elapsed times.
         
         Arguments:
             elapsed_time_sec: Elapsed time since launch (in seconds)
@@ -197,7 +409,7 @@ class BallisticMissile(Missile):
         Returns:
             current vertical velocity (km/s)
         """
-        change_in_velocity = constants['GRAVITY_ACCEL_KM_PER_S2'] * elapsed_time_sec
+        change_in_velocity = GRAVITY_ACCEL_KM_PER_S2 * elapsed_time_sec
         return (
             self.build_data['initial_vertical_velocity_km_sec'] 
             + change_in_velocity
@@ -213,11 +425,250 @@ class BallisticMissile(Missile):
             kml_document: simplekml document in which to add KML trajectory data
 
         Returns:
-            simplekml document > missile folder > timestep folders > 
-            COLLADA model and linestring elements
+            simplekml document > missile folder > GxTrack element (or, if
+            params['emit_per_step_models'] is True, timestep folders >
+            COLLADA model and linestring elements)
         """
         kml_converter = KMLTrajectoryConverter(
             self.params,
             self.trajectory_data,
         )
         return kml_converter.create_kml_trajectory(kml_document)
+
+    def create_kml_track(
+        self,
+        kml_document: simplekml.Document,
+    ) -> simplekml.Document:
+        """Convert missile trajectory data to a single animated KML GxTrack.
+
+        Arguments:
+            kml_document: simplekml document in which to add KML trajectory data
+
+        Returns:
+            simplekml document > missile folder > GxTrack element
+        """
+        kml_converter = KMLTrajectoryConverter(
+            self.params,
+            self.trajectory_data,
+        )
+        return kml_converter.create_kml_track(kml_document)
+
+
+class BallisticMissileBatch():
+    """Batch of ballistic missiles stored as columnar (structure-of-arrays)
+    float64 data, with all trajectories computed in a single vectorized pass.
+    Trajectory values match those of BallisticMissile for each missile.
+
+    Attributes:
+        params_list: list of dicts of user-defined parameter values (one per missile)
+        LP_latlon_deg: (M, 2) float64 array of launchpoint (latitude, longitude) in degrees
+        AP_latlon_deg: (M, 2) float64 array of aimpoint (latitude, longitude) in degrees
+        horizontal_velocity_km_sec: (M,) float64 array of horizontal velocity (km/s)
+        timestep_sec: timestep (seconds) shared by all missiles in batch
+        build_data: dict of (M,) arrays of static characteristics of each missile
+        trajectory_data: dict of (N,) time array, (M,) number of timesteps per
+            missile, and (M, N) position/orientation arrays; timesteps after a
+            missile's final timestep are NaN
+
+    Methods:
+        build
+        launch
+        get_missile_trajectory_data
+        create_kml_trajectory
+    """
+
+    def __init__(self, params_list: List[Dict]) -> None:
+        """Instantiate BallisticMissileBatch.
+
+        Arguments
+            params_list: list of dicts of user-defined parameter values
+        """
+        timesteps_sec = {params['timestep_sec'] for params in params_list}
+        if len(timesteps_sec) != 1:
+            raise ValueError(
+                'All missiles in a batch must share the same timestep_sec.'
+            )
+        self.params_list = params_list
+        # Missing values are stored as NaN (rejected by build())
+        self.LP_latlon_deg = np.array(
+            [_get_param_or_nan(params, 'LP_latlon_deg', 2) for params in params_list],
+            dtype=np.float64,
+        ).reshape(-1, 2)
+        self.AP_latlon_deg = np.array(
+            [_get_param_or_nan(params, 'AP_latlon_deg', 2) for params in params_list],
+            dtype=np.float64,
+        ).reshape(-1, 2)
+        self.horizontal_velocity_km_sec = np.array(
+            [
+                _get_param_or_nan(params, 'horizontal_velocity_km_sec')
+                for params in params_list
+            ],
+            dtype=np.float64,
+        )
+        self.timestep_sec = timesteps_sec.pop()
+        self.build_data = None
+        self.trajectory_data = None
+
+    def _validate_inputs(self) -> None:
+        """Raise ValueError if inputs required by build() are missing or
+        invalid for any missile (see BallisticMissile._validate_inputs)."""
+        timestep_sec = self.timestep_sec
+        if timestep_sec is None or not (np.isfinite(timestep_sec) and timestep_sec > 0):
+            raise ValueError(
+                f'Positive, finite timestep_sec required (got {timestep_sec}).'
+            )
+        horizontal_velocity_km_sec = self.horizontal_velocity_km_sec
+        checks = [
+            (~np.isfinite(self.LP_latlon_deg).all(axis=1), 'Finite launchpoint required'),
+            (~np.isfinite(self.AP_latlon_deg).all(axis=1), 'Finite aimpoint required'),
+            (
+                ~(np.isfinite(horizontal_velocity_km_sec) & (horizontal_velocity_km_sec > 0)),
+                'Positive, finite horizontal_velocity_km_sec required',
+            ),
+        ]
+        for invalid_mask, message in checks:
+            if invalid_mask.any():
+                missile_idx = np.flatnonzero(invalid_mask).tolist()
+                raise ValueError(f'{message} (missile indices {missile_idx}).')
+
+    def build(self) -> None:
+        """Compute static characteristics of all ballistic missiles (see
+        BallisticMissile.build) as (M,) arrays. Raises ValueError if any
+        missile's launchpoint, aimpoint, or horizontal velocity is missing
+        or invalid.
+        """
+        self._validate_inputs()
+        LP_lat_deg, LP_lon_deg = self.LP_latlon_deg.T
+        AP_lat_deg, AP_lon_deg = self.AP_latlon_deg.T
+        dist_to_target_km, bearing_deg = calculate_great_circle_distance_and_bearing(
+            LP_lat_deg, LP_lon_deg, AP_lat_deg, AP_lon_deg,
+        )
+        self.build_data = _compute_trajectory_statics(
+            dist_to_target_km, bearing_deg, self.horizontal_velocity_km_sec,
+        )._asdict()
+
+    def launch(
+        self,
+        stoptime_sec: Optional[float] = None,
+        dtype: np.dtype = TRAJECTORY_DTYPE,
+    ) -> None:
+        """Record position (latitude, longitude, altitude) and orientation
+        (heading, tilt, and roll) of all missiles for each timestep from
+        launch until impact as (M, N) arrays.
+
+        Arguments
+            stoptime_sec: maximum time (seconds) for which to calculate missile
+                position and orientation; if None (default), use each missile's
+                total time to target (must not exceed any missile's total time
+                to target by more than STOPTIME_TOLERANCE_SEC; clamped to each
+                missile's total time to target)
+            dtype: dtype of stored altitude/orientation arrays (computation is
+                always done in float64; latitude/longitude are stored as float64)
+        """
+        if self.build_data is None:
+            raise RuntimeError('Missiles must be built (call build()) before launch.')
+        build_data = self.build_data
+        timestep_sec = self.timestep_sec
+        total_time_to_target_sec = build_data['total_time_to_target_sec']
+        if stoptime_sec is None:
+            stoptime_sec = total_time_to_target_sec
+        elif np.any(stoptime_sec > total_time_to_target_sec + STOPTIME_TOLERANCE_SEC):
+            raise ValueError(
+                f'stoptime_sec ({stoptime_sec}) exceeds total time to target '
+                'of at least one missile.'
+            )
+        else:
+            stoptime_sec = np.minimum(stoptime_sec, total_time_to_target_sec)
+        stoptime_sec = np.broadcast_to(
+            np.asarray(stoptime_sec, dtype=np.float64), (len(self.params_list),)
+        )
+        # Same number of timesteps as np.arange(0, stoptime + timestep, timestep)
+        n_timesteps = np.ceil(
+            (stoptime_sec + timestep_sec) / timestep_sec
+        ).astype(np.int64)
+        time_sec = np.arange(n_timesteps.max(), dtype=np.float64) * timestep_sec
+        t = time_sec[None, :]
+        horizontal_velocity_km_sec = build_data['horizontal_velocity_km_sec'][:, None]
+        initial_vertical_velocity_km_sec = (
+            build_data['initial_vertical_velocity_km_sec'][:, None]
+        )
+        # Position
+        lat_deg, lon_deg = determine_destination_coords(
+            origin_lat_deg=self.LP_latlon_deg[:, 0:1],
+            origin_lon_deg=self.LP_latlon_deg[:, 1:2],
+            distance_km=horizontal_velocity_km_sec * t,
+            initial_bearing_deg=build_data['launchpoint_bearing_deg'][:, None],
+        )
+        # Vertical velocity and altitude share the gravity term
+        gravity_term = GRAVITY_ACCEL_KM_PER_S2 * t
+        vertical_velocity_km_sec = initial_vertical_velocity_km_sec + gravity_term
+        alt_km = t * (initial_vertical_velocity_km_sec + 0.5 * gravity_term)
+        np.maximum(alt_km, 0, out=alt_km)
+        # Orientation
+        bearing_deg = calculate_initial_bearing(
+            lat_deg, lon_deg,
+            self.AP_latlon_deg[:, 0:1], self.AP_latlon_deg[:, 1:2],
+        )
+        tilt_deg = _compute_kml_tilt_deg(
+            vertical_velocity_km_sec, horizontal_velocity_km_sec,
+        )
+        trajectory_data = {
+            'time_sec':time_sec,
+            'n_timesteps':n_timesteps,
+            'lat_deg':lat_deg,
+            'lon_deg':lon_deg,
+            'alt_km':alt_km,
+            'bearing_deg':bearing_deg,
+            'tilt_deg':tilt_deg,
+            'roll_deg':np.zeros_like(lat_deg),
+        }
+        invalid_mask = np.arange(len(time_sec))[None, :] >= n_timesteps[:, None]
+        for key in ['lat_deg', 'lon_deg', 'alt_km', 'bearing_deg', 'tilt_deg', 'roll_deg']:
+            if key not in ('lat_deg', 'lon_deg'):
+                trajectory_data[key] = trajectory_data[key].astype(dtype, copy=False)
+            trajectory_data[key][invalid_mask] = np.nan
+        self.trajectory_data = trajectory_data
+
+    def get_missile_trajectory_data(self, missile_idx: int) -> TrajectoryArrays:
+        """Get trajectory data for a single missile in the same format as
+        BallisticMissile.trajectory_data.
+
+        Arguments:
+            missile_idx: index of missile in params_list
+
+        Returns:
+            TrajectoryArrays of missile position/orientation for each timestep
+        """
+        data = self.trajectory_data
+        n_timesteps = data['n_timesteps'][missile_idx]
+        return TrajectoryArrays(
+            time_sec=data['time_sec'][:n_timesteps],
+            lat_deg=data['lat_deg'][missile_idx, :n_timesteps],
+            lon_deg=data['lon_deg'][missile_idx, :n_timesteps],
+            alt_km=data['alt_km'][missile_idx, :n_timesteps],
+            bearing_deg=data['bearing_deg'][missile_idx, :n_timesteps],
+            tilt_deg=data['tilt_deg'][missile_idx, :n_timesteps],
+            roll_deg=data['roll_deg'][missile_idx, :n_timesteps],
+        )
+
+    def create_kml_trajectory(
+        self,
+        kml_document: simplekml.Document,
+    ) -> simplekml.Document:
+        """Convert trajectory data of all missiles to KML.
+
+        Arguments:
+            kml_document: simplekml document in which to add KML trajectory data
+
+        Returns:
+            simplekml document > missile folders > GxTrack elements (or, if
+            params['emit_per_step_models'] is True, timestep folders >
+            COLLADA model and linestring elements)
+        """
+        for missile_idx, params in enumerate(self.params_list):
+            kml_converter = KMLTrajectoryConverter(
+                params,
+                self.get_missile_trajectory_data(missile_idx),
+            )
+            kml_document = kml_converter.create_kml_trajectory(kml_document)
+        return kml_document
@@ -6,32 +6,31 @@ Contents:
         TerminalInterceptor (in progress)
 """
 # Import packages
-from collections import OrderedDict
-from typing import Dict, Optional, Type
+from typing import Dict, Optional
 
-import numpy as np
-
-import simplekml
-
-from kml_converters import KMLTrajectoryConverter
 from missiles_abstract import Missile
-from utils import get_constants
-from utils_geo import (
-    calculate_cross_track_distance,
-)
-
-# Get constants
-constants = get_constants()
 
 # Define classes
 class TerminalInterceptor(Missile):
     """Base class for terminal phase interceptors.
 
-    Attributes
-
-    Methods
-
+    Attributes:
+        params: dict of user-defined parameter values
+        LP_latlon_deg: float64 array of launchpoint (latitude, longitude) in degrees
+        AP_latlon_deg: float64 array of aimpoint (latitude, longitude) in degrees
+        targeted_missile: missile instance targeted by interceptor
+        build_data: dict of static characteristics of interceptor
+        trajectory_data: TrajectoryArrays of interceptor position/orientation
+            for each timestep (one array per field, as for BallisticMissile)
+
+    Methods:
+        determine_missile_in_ground_range
+        build
+        launch
+        get_current_position
+        get_current_orientation
     """
+    __slots__ = ('targeted_missile', 'build_data', 'trajectory_data')
     
     def __init__(self, params: Dict) -> None:
         """Instantiate TerminalInterceptor.
@@ -81,7 +80,8 @@ class TerminalInterceptor(Missile):
             elapsed_time_sec: elapsed time since launch (seconds)
 
         Returns
-            dict containing lat_deg, lon_deg, and alt_km
+            dict containing lat_deg, lon_deg, and alt_km (arrays if
+            elapsed_time_sec is an array)
         """
         pass
 
@@ -98,19 +98,3 @@ class TerminalInterceptor(Missile):
             dict containing bearing_deg, tilt_deg, and roll_deg
         """
         pass
-
-    # def set_intercept_surface_to_air_distance(self) -> None:
-    #     """Compute and set the straight-line distance between interceptor launch
-    #     point and intercept location."""
-    #     interceptor_LP_vector = geo.convert_lat_lon_alt_to_nvector(
-    #         lat_deg=self.LP_latlon_deg[0],
-    #         lon_deg=self.LP_latlon_deg[1],
-    #     )
-    #     intercept_position_vector = geo.convert_lat_lon_alt_to_nvector(
-    #         lat_deg=self.intercept_position_dict['lat_deg'],
-    #         lon_deg=self.intercept_position_dict['lon_deg'],
-    #         alt_km=self.intercept_position_dict['alt_km'],
-    #     )
-    #     self.intercept_surface_to_air_dist_km = geo.calculate_magnitude_dist_bt_vectors(
-    #         interceptor_LP_vector, intercept_position_vector,
-    #     )
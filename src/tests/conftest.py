@@ -0,0 +1,13 @@
+"""
+Shared pytest configuration for src tests.
+
+Simulation modules import their siblings as top-level modules (as when run
+via `python main.py` from src), so src must be on sys.path for the tests.
+"""
+# Import packages
+import os
+import sys
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
@@ -0,0 +1,203 @@
+"""
+Unit tests for kml_converters.py.
+"""
+# Import packages
+from datetime import datetime, timedelta
+import re
+import xml.etree.ElementTree as ET
+
+import numpy as np
+
+import simplekml
+
+from ..kml_converters import (
+    KML_ALT_DECIMALS,
+    KML_ANGLE_DECIMALS,
+    KML_LATLON_DECIMALS,
+    KMLTrajectoryConverter,
+    format_kml_timestamps,
+    is_flag_set,
+    round_kml_values,
+)
+from ..missiles_ballistic import BallisticMissile
+
+# Define test data shared by KML tests
+KML_NAMESPACES = {
+    'kml':'http://www.opengis.net/kml/2.2',
+    'gx':'http://www.google.com/kml/ext/2.2',
+}
+
+# Define helper functions
+def make_params(
+    emit_per_step_models: object = False,
+    sim_time_buffer_sec: float = 10.0,
+) -> dict:
+    """Create parameter dict for a short ballistic missile simulation."""
+    return {
+        'missile_name':'missile1',
+        'launch_time':datetime(2020, 7, 30, 4, 0, 0),
+        'LP_latlon_deg':(39.516825, -104.95567),
+        'AP_latlon_deg':(39.616825, -104.95567),
+        'horizontal_velocity_km_sec':1.0,
+        'timestep_sec':1.0,
+        'sim_start_time_buffer_sec':sim_time_buffer_sec,
+        'sim_end_time_buffer_sec':sim_time_buffer_sec,
+        'collada_model_path':'test_missile.dae',
+        'collada_model_scale':1,
+        'emit_per_step_models':emit_per_step_models,
+    }
+
+def launch_missile(params: dict) -> BallisticMissile:
+    """Build and launch ballistic missile."""
+    missile = BallisticMissile(params)
+    missile.build()
+    missile.launch()
+    return missile
+
+def create_kml_text(params: dict) -> str:
+    """Launch missile and return KML text of its trajectory."""
+    missile = launch_missile(params)
+    kml = simplekml.Kml()
+    KMLTrajectoryConverter(params, missile.trajectory_data).create_kml_trajectory(
+        kml.document
+    )
+    return kml.kml()
+
+def count_decimals(value: str) -> int:
+    """Count the number of decimal places in a number string."""
+    return len(value.partition('.')[2])
+
+# Define tests
+def test_round_kml_values():
+    """Test that round_kml_values returns Python floats without float32 digits."""
+    values = np.array([-105.0217, 729.63, 0.0], dtype=np.float32)
+    rounded = round_kml_values(values, 4)
+    errors_list = []
+    if rounded != [-105.0217, 729.63, 0.0]:
+        errors_list.append(f'Unexpected rounded values {rounded}.')
+    if any(type(value) is not float for value in rounded):
+        errors_list.append('Rounded values are not Python floats.')
+    assert not errors_list, 'Errors occurred: \n{}'.format('\n'.join(errors_list))
+
+def test_format_kml_timestamps():
+    """Test that format_kml_timestamps formats datetimes and datetime64 arrays
+    as ISO 8601 UTC timestamps truncated to the second.
+    """
+    times = [datetime(2020, 7, 30, 4, 0, 0), datetime(2020, 7, 30, 23, 59, 59, 999999)]
+    expected = ['2020-07-30T04:00:00Z', '2020-07-30T23:59:59Z']
+    errors_list = []
+    for case in [times, np.array(times, dtype='datetime64[us]')]:
+        timestamps = format_kml_timestamps(case)
+        if timestamps != expected:
+            errors_list.append(f'Unexpected timestamps {timestamps}.')
+    assert not errors_list, 'Errors occurred: \n{}'.format('\n'.join(errors_list))
+
+def test_kml_value_precision():
+    """Test that coordinates and angles written to KML (GxTrack and
+    per-step output) are rounded to the KML precision constants.
+    """
+    errors_list = []
+    for emit_per_step_models in [False, True]:
+        kml_text = create_kml_text(make_params(emit_per_step_models))
+        lon_lat_alt_strings = [
+            coord.split() for coord in re.findall(r'<gx:coord>([^<]+)<', kml_text)
+        ] + [
+            coord.split(',')
+            for coords in re.findall(r'<coordinates>([^<]+)<', kml_text)
+            for coord in coords.split()
+        ]
+        angle_strings = re.findall(
+            r'<(?:heading|tilt|roll)>([^<]+)<', kml_text,
+        ) + [
+            angle for angles in re.findall(r'<gx:angles>([^<]+)<', kml_text)
+            for angle in angles.split()
+        ]
+        if not lon_lat_alt_strings or not angle_strings:
+            errors_list.append(f'No KML values found (per-step={emit_per_step_models}).')
+        for lon, lat, alt in lon_lat_alt_strings:
+            if max(count_decimals(lon), count_decimals(lat)) > KML_LATLON_DECIMALS:
+                errors_list.append(f'Unrounded coordinate {lon}, {lat}.')
+            if count_decimals(alt) > KML_ALT_DECIMALS:
+                errors_list.append(f'Unrounded altitude {alt}.')
+        for angle in angle_strings:
+            if count_decimals(angle) > KML_ANGLE_DECIMALS:
+                errors_list.append(f'Unrounded angle {angle}.')
+    assert not errors_list, 'Errors occurred: \n{}'.format('\n'.join(errors_list))
+
+def test_kml_track_elements():
+    """Test that the default GxTrack output has one when, gx:coord, and
+    gx:angles element per point, and that it spans the simulation start/end
+    time buffers (or only the trajectory if the buffers are zero).
+    """
+    errors_list = []
+    for sim_time_buffer_sec in [10.0, 0.0]:
+        params = make_params(sim_time_buffer_sec=sim_time_buffer_sec)
+        trajectory_data = launch_missile(params).trajectory_data
+        n_timesteps = len(trajectory_data)
+        root = ET.fromstring(create_kml_text(params))
+        tracks = root.findall('.//gx:Track', KML_NAMESPACES)
+        if len(tracks) != 1:
+            errors_list.append(f'Expected 1 gx:Track, got {len(tracks)}.')
+            continue
+        whens = [when.text for when in tracks[0].findall('kml:when', KML_NAMESPACES)]
+        n_coords = len(tracks[0].findall('gx:coord', KML_NAMESPACES))
+        n_angles = len(tracks[0].findall('gx:angles', KML_NAMESPACES))
+        n_buffers = 2 if sim_time_buffer_sec > 0 else 0
+        if not len(whens) == n_coords == n_angles == n_timesteps + n_buffers:
+            errors_list.append(
+                f'Buffer {sim_time_buffer_sec}: {len(whens)} when, {n_coords} '
+                f'gx:coord, {n_angles} gx:angles (expected {n_timesteps + n_buffers}).'
+            )
+        expected_start_time = params['launch_time'] - timedelta(
+            seconds=sim_time_buffer_sec
+        )
+        expected_end_time = params['launch_time'] + timedelta(
+            seconds=(trajectory_data.time_sec[-1] + sim_time_buffer_sec)
+        )
+        if whens[0] != expected_start_time.strftime('%Y-%m-%dT%H:%M:%SZ'):
+            errors_list.append(f'Buffer {sim_time_buffer_sec}: track starts at {whens[0]}.')
+        if whens[-1] != expected_end_time.strftime('%Y-%m-%dT%H:%M:%SZ'):
+            errors_list.append(f'Buffer {sim_time_buffer_sec}: track ends at {whens[-1]}.')
+    assert not errors_list, 'Errors occurred: \n{}'.format('\n'.join(errors_list))
+
+def test_emit_per_step_models_flag():
+    """Test that per-step models are emitted only if emit_per_step_models is a
+    boolean True (blank Excel cells are read as NaN and text such as 'FALSE'
+    is truthy; both must give the default GxTrack output).
+    """
+    test_cases = [
+        {'value':True, 'per_step':True},
+        {'value':np.True_, 'per_step':True},
+        {'value':False, 'per_step':False},
+        {'value':np.nan, 'per_step':False},
+        {'value':float('nan'), 'per_step':False},
+        {'value':'FALSE', 'per_step':False},
+        {'value':'TRUE', 'per_step':False},
+        {'value':None, 'per_step':False},
+    ]
+    errors_list = []
+    for case in test_cases:
+        if is_flag_set(case['value']) != case['per_step']:
+            errors_list.append(f'is_flag_set({case["value"]!r}) is not {case["per_step"]}.')
+        root = ET.fromstring(create_kml_text(make_params(case['value'])))
+        n_models = len(root.findall('.//kml:Model', KML_NAMESPACES))
+        n_tracks = len(root.findall('.//gx:Track', KML_NAMESPACES))
+        is_per_step = n_models > 1 and n_tracks == 0
+        if is_per_step != case['per_step']:
+            errors_list.append(
+                f'emit_per_step_models={case["value"]!r}: {n_models} Model, '
+                f'{n_tracks} gx:Track elements.'
+            )
+    params = make_params()
+    del params['emit_per_step_models']
+    root = ET.fromstring(create_kml_text(params))
+    if len(root.findall('.//gx:Track', KML_NAMESPACES)) != 1:
+        errors_list.append('Missing emit_per_step_models did not emit a gx:Track.')
+    assert not errors_list, 'Errors occurred: \n{}'.format('\n'.join(errors_list))
+
+if __name__ == '__main__':
+    test_round_kml_values()
+    test_format_kml_timestamps()
+    test_kml_value_precision()
+    test_kml_track_elements()
+    test_emit_per_step_models_flag()
@@ -0,0 +1,86 @@
+"""
+Unit tests for main.py.
+"""
+# Import packages
+from datetime import datetime
+import os
+import tempfile
+import zipfile
+
+import numpy as np
+
+from ..main import parse_config, run_group
+
+# Define test data shared by main tests
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+CONFIG_PATH = os.path.join(REPO_DIR, 'config', 'config.xlsx')
+ATTACHMENT_DIR = os.path.join(REPO_DIR, 'blender')
+EXPECTED_GROUPS = {
+    'test_group1':['Simulation1', 'Simulation2'],
+    'test_group2':['Simulation3', 'Simulation4', 'Simulation5'],
+}
+
+# Define tests
+def test_parse_config():
+    """Test that parse_config creates nested dict {group:{simulation:{param:value}}}
+    with derived launchpoint/aimpoint, model path, and launch time parameters.
+    """
+    config = parse_config(CONFIG_PATH)
+    errors_list = []
+    if {group:list(sims) for group, sims in config.items()} != EXPECTED_GROUPS:
+        errors_list.append(f'Unexpected groups/simulations {config}.')
+    for group, sim_params_dict in config.items():
+        for sim, params in sim_params_dict.items():
+            if params['group_name'] != group:
+                errors_list.append(f'{sim}: group_name {params["group_name"]}.')
+            if params['LP_latlon_deg'] != (params['LP_lat_deg'], params['LP_lon_deg']):
+                errors_list.append(f'{sim}: LP_latlon_deg {params["LP_latlon_deg"]}.')
+            if params['AP_latlon_deg'] != (params['AP_lat_deg'], params['AP_lon_deg']):
+                errors_list.append(f'{sim}: AP_latlon_deg {params["AP_latlon_deg"]}.')
+            expected_model_path = os.path.join(
+                params['collada_model_dir'], params['collada_model_file'],
+            )
+            if params['collada_model_path'] != expected_model_path:
+                errors_list.append(f'{sim}: collada_model_path {params["collada_model_path"]}.')
+            launch_time = params['launch_time']
+            if type(launch_time) is not datetime:
+                errors_list.append(f'{sim}: launch_time is {type(launch_time)}.')
+            elif launch_time != datetime.combine(
+                params['launch_date'], params['launch_time_UTC'],
+            ):
+                errors_list.append(f'{sim}: launch_time {launch_time}.')
+            if not np.isfinite(params['timestep_sec']):
+                errors_list.append(f'{sim}: timestep_sec {params["timestep_sec"]}.')
+    assert not errors_list, 'Errors occurred: \n{}'.format('\n'.join(errors_list))
+
+def test_run_group():
+    """Test that run_group saves one KMZ per group (creating the output
+    directory) containing one GxTrack per simulation and the COLLADA model.
+    """
+    config = parse_config(CONFIG_PATH)
+    errors_list = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_dir = os.path.join(temp_dir, 'kml')
+        for group, sim_params_dict in config.items():
+            run_group(
+                group, sim_params_dict,
+                output_dir=output_dir, attachment_dir=ATTACHMENT_DIR,
+            )
+        for group, sims in EXPECTED_GROUPS.items():
+            kmz_path = os.path.join(output_dir, f'{group}.kmz')
+            if not os.path.isfile(kmz_path):
+                errors_list.append(f'{group}: KMZ file not saved.')
+                continue
+            with zipfile.ZipFile(kmz_path) as kmz:
+                names = kmz.namelist()
+                kml_text = kmz.read('doc.kml').decode('utf-8')
+            if not any(name.endswith('test_missile.dae') for name in names):
+                errors_list.append(f'{group}: COLLADA model missing from {names}.')
+            n_tracks = kml_text.count('<gx:Track')
+            if n_tracks != len(sims):
+                errors_list.append(f'{group}: {n_tracks} gx:Track (expected {len(sims)}).')
+    assert not errors_list, 'Errors occurred: \n{}'.format('\n'.join(errors_list))
+
+if __name__ == '__main__':
+    test_parse_config()
+    test_run_group()
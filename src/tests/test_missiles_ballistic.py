@@ -0,0 +1,271 @@
+"""
+Unit tests for missiles_ballistic.py.
+"""
+# Import packages
+from dataclasses import asdict
+import math
+
+import numpy as np
+
+from ..missiles_ballistic import (
+    BallisticMissile,
+    BallisticMissileBatch,
+    _build_time_grid,
+)
+
+# Define test data shared by ballistic missile tests
+AP_LATLON_DEG = (40.862397, -105.025902)
+LP_LATLON_DEG = [
+    (39.516825, -104.95567),
+    (39.485511, -104.884624),
+    (39.504076, -104.903619),
+]
+
+# Define helper functions
+def make_params(
+    LP_latlon_deg: tuple = LP_LATLON_DEG[0],
+    horizontal_velocity_km_sec: float = 1.0,
+    timestep_sec: float = 1.0,
+) -> dict:
+    """Create minimal parameter dict for a ballistic missile simulation."""
+    return {
+        'LP_latlon_deg':LP_latlon_deg,
+        'AP_latlon_deg':AP_LATLON_DEG,
+        'horizontal_velocity_km_sec':horizontal_velocity_km_sec,
+        'timestep_sec':timestep_sec,
+    }
+
+# Define tests
+def test_get_current_orientation_vectorized():
+    """Test that get_current_orientation accepts an array of elapsed times and
+    matches the scalar result at each timestep.
+    """
+    missile = BallisticMissile(make_params())
+    missile.build()
+    time_sec = np.array([0.0, 10.5, 75.0, 149.0])
+    orientation_arr = missile.get_current_orientation(time_sec)
+    errors_list = []
+    for key in ['bearing_deg', 'tilt_deg']:
+        if np.shape(orientation_arr[key]) != time_sec.shape:
+            errors_list.append(f'{key} has shape {np.shape(orientation_arr[key])}.')
+    for idx, elapsed_time_sec in enumerate(time_sec):
+        orientation = missile.get_current_orientation(float(elapsed_time_sec))
+        for key in ['bearing_deg', 'tilt_deg']:
+            if not np.isclose(orientation_arr[key][idx], orientation[key]):
+                errors_list.append(f'Vectorized {key} differs for index {idx}.')
+    assert not errors_list, 'Errors occurred: \n{}'.format('\n'.join(errors_list))
+
+def test_launch_stoptime_exceeds_time_to_target():
+    """Test that launch raises ValueError when stoptime_sec exceeds total time
+    to target (single missile and batch).
+    """
+    missile = BallisticMissile(make_params())
+    missile.build()
+    batch = BallisticMissileBatch([make_params(LP) for LP in LP_LATLON_DEG])
+    batch.build()
+    test_cases = {
+        'BallisticMissile':(
+            missile, missile.build_data['total_time_to_target_sec'] + 1.0,
+        ),
+        'BallisticMissileBatch':(
+            batch, batch.build_data['total_time_to_target_sec'].max() + 1.0,
+        ),
+    }
+    errors_list = []
+    for name, (launcher, stoptime_sec) in test_cases.items():
+        try:
+            launcher.launch(stoptime_sec=stoptime_sec)
+            errors_list.append(f'{name} did not raise ValueError.')
+        except ValueError:
+            pass
+    assert not errors_list, 'Errors occurred: \n{}'.format('\n'.join(errors_list))
+
+def test_launch_stoptime_at_time_to_target():
+    """Test that a stoptime_sec within floating-point round-off of total time
+    to target is accepted and clamped (same grid as the default stoptime).
+    """
+    errors_list = []
+    missile = BallisticMissile(make_params())
+    missile.build()
+    total_time_to_target_sec = missile.build_data['total_time_to_target_sec']
+    missile.launch()
+    expected_time_sec = missile.trajectory_data.time_sec
+    for stoptime_sec in [
+        total_time_to_target_sec,
+        np.nextafter(total_time_to_target_sec, np.inf),
+        total_time_to_target_sec + 1e-9,
+    ]:
+        missile.launch(stoptime_sec=float(stoptime_sec))
+        if not np.array_equal(missile.trajectory_data.time_sec, expected_time_sec):
+            errors_list.append(f'Time grid differs for stoptime_sec {stoptime_sec!r}.')
+    batch = BallisticMissileBatch([make_params(LP) for LP in LP_LATLON_DEG])
+    batch.build()
+    batch.launch()
+    expected_n_timesteps = batch.trajectory_data['n_timesteps']
+    batch.launch(
+        stoptime_sec=np.nextafter(batch.build_data['total_time_to_target_sec'], np.inf)
+    )
+    if not np.array_equal(batch.trajectory_data['n_timesteps'], expected_n_timesteps):
+        errors_list.append('Batch timesteps differ at total time to target.')
+    assert not errors_list, 'Errors occurred: \n{}'.format('\n'.join(errors_list))
+
+def test_build_time_grid():
+    """Test that _build_time_grid returns a read-only grid of integer multiples
+    of timestep_sec with ceil((stoptime + timestep) / timestep) timesteps,
+    including stoptimes that are not integer multiples of the timestep.
+    """
+    test_cases = [
+        {'stoptime_sec':10.0, 'timestep_sec':1.0},
+        {'stoptime_sec':10.5, 'timestep_sec':1.0},
+        {'stoptime_sec':1.0, 'timestep_sec':0.3},
+        {'stoptime_sec':149.38, 'timestep_sec':0.25},
+    ]
+    errors_list = []
+    for case in test_cases:
+        stoptime_sec, timestep_sec = case['stoptime_sec'], case['timestep_sec']
+        time_sec = _build_time_grid(stoptime_sec, timestep_sec)
+        expected_len = math.ceil((stoptime_sec + timestep_sec) / timestep_sec)
+        if len(time_sec) != expected_len:
+            errors_list.append(
+                f'{case}: expected {expected_len} timesteps, got {len(time_sec)}.'
+            )
+        if not np.array_equal(time_sec, np.arange(expected_len) * timestep_sec):
+            errors_list.append(f'{case}: times are not multiples of timestep_sec.')
+        if time_sec.flags.writeable:
+            errors_list.append(f'{case}: time grid is writeable.')
+        try:
+            time_sec[0] = 1.0
+            errors_list.append(f'{case}: write to time grid did not raise.')
+        except ValueError:
+            pass
+    assert not errors_list, 'Errors occurred: \n{}'.format('\n'.join(errors_list))
+
+def test_batch_matches_single_missiles():
+    """Test that BallisticMissileBatch trajectories match BallisticMissile
+    trajectories for each missile (within float32 storage tolerance).
+    """
+    params_list = [
+        make_params(LP, horizontal_velocity_km_sec=velocity)
+        for LP, velocity in zip(LP_LATLON_DEG, [1.0, 1.5, 0.8])
+    ]
+    batch = BallisticMissileBatch(params_list)
+    batch.build()
+    batch.launch()
+    errors_list = []
+    for missile_idx, params in enumerate(params_list):
+        missile = BallisticMissile(params)
+        missile.build()
+        missile.launch()
+        for key, value in missile.build_data.items():
+            if not np.isclose(batch.build_data[key][missile_idx], value):
+                errors_list.append(f'Missile {missile_idx}: build_data {key} differs.')
+        expected = missile.trajectory_data
+        actual = batch.get_missile_trajectory_data(missile_idx)
+        if len(actual) != len(expected):
+            errors_list.append(
+                f'Missile {missile_idx}: expected {len(expected)} timesteps, '
+                f'got {len(actual)}.'
+            )
+            continue
+        for key in asdict(expected):
+            if not np.allclose(
+                getattr(actual, key), getattr(expected, key), rtol=1e-6, atol=1e-4,
+            ):
+                errors_list.append(f'Missile {missile_idx}: {key} differs.')
+    assert not errors_list, 'Errors occurred: \n{}'.format('\n'.join(errors_list))
+
+def test_batch_trajectory_padding():
+    """Test that batch timesteps after each missile's final timestep are NaN
+    and that get_missile_trajectory_data returns only valid timesteps.
+    """
+    params_list = [
+        make_params(LP, horizontal_velocity_km_sec=velocity)
+        for LP, velocity in zip(LP_LATLON_DEG, [1.0, 1.5, 0.8])
+    ]
+    batch = BallisticMissileBatch(params_list)
+    batch.build()
+    batch.launch()
+    data = batch.trajectory_data
+    errors_list = []
+    if len(set(data['n_timesteps'].tolist())) < 2:
+        errors_list.append('Test missiles should have different numbers of timesteps.')
+    if len(data['time_sec']) != data['n_timesteps'].max():
+        errors_list.append('Time grid length differs from longest missile.')
+    for missile_idx, n_timesteps in enumerate(data['n_timesteps']):
+        missile_data = batch.get_missile_trajectory_data(missile_idx)
+        for key, value in asdict(missile_data).items():
+            if len(value) != n_timesteps:
+                errors_list.append(
+                    f'Missile {missile_idx}: {key} has {len(value)} timesteps '
+                    f'(expected {n_timesteps}).'
+                )
+            if key == 'time_sec':
+                continue
+            if np.isnan(value).any():
+                errors_list.append(f'Missile {missile_idx}: NaN in valid {key}.')
+            if not np.isnan(data[key][missile_idx, n_timesteps:]).all():
+                errors_list.append(f'Missile {missile_idx}: padded {key} is not NaN.')
+    assert not errors_list, 'Errors occurred: \n{}'.format('\n'.join(errors_list))
+
+def test_batch_invalid_inputs():
+    """Test that BallisticMissileBatch raises ValueError for mixed timesteps
+    and for missing or invalid launch parameters.
+    """
+    test_cases = {
+        'mixed timestep_sec':[make_params(timestep_sec=1.0), make_params(timestep_sec=0.5)],
+        'missing launchpoint':[make_params(), make_params(LP_latlon_deg=None)],
+        'NaN aimpoint':[
+            make_params(),
+            {**make_params(), 'AP_latlon_deg':(np.nan, AP_LATLON_DEG[1])},
+        ],
+        'zero horizontal velocity':[make_params(horizontal_velocity_km_sec=0.0)],
+        'negative horizontal velocity':[make_params(horizontal_velocity_km_sec=-1.0)],
+        'infinite horizontal velocity':[make_params(horizontal_velocity_km_sec=np.inf)],
+        'zero timestep_sec':[make_params(timestep_sec=0.0)],
+        'negative timestep_sec':[make_params(timestep_sec=-1.0)],
+        'NaN timestep_sec':[make_params(timestep_sec=np.nan)],
+    }
+    errors_list = []
+    for name, params_list in test_cases.items():
+        try:
+            batch = BallisticMissileBatch(params_list)
+            batch.build()
+            errors_list.append(f'{name}: did not raise ValueError.')
+        except ValueError:
+            pass
+    assert not errors_list, 'Errors occurred: \n{}'.format('\n'.join(errors_list))
+
+def test_invalid_inputs():
+    """Test that BallisticMissile.build raises ValueError for missing or
+    non-finite coordinates and non-positive or non-finite horizontal
+    velocity and timestep.
+    """
+    test_cases = {
+        'missing launchpoint':make_params(LP_latlon_deg=None),
+        'NaN launchpoint':make_params(LP_latlon_deg=(np.nan, LP_LATLON_DEG[0][1])),
+        'NaN aimpoint':{**make_params(), 'AP_latlon_deg':(AP_LATLON_DEG[0], np.nan)},
+        'infinite aimpoint':{**make_params(), 'AP_latlon_deg':(np.inf, AP_LATLON_DEG[1])},
+        'zero horizontal velocity':make_params(horizontal_velocity_km_sec=0.0),
+        'NaN horizontal velocity':make_params(horizontal_velocity_km_sec=np.nan),
+        'zero timestep_sec':make_params(timestep_sec=0.0),
+        'negative timestep_sec':make_params(timestep_sec=-1.0),
+        'infinite timestep_sec':make_params(timestep_sec=np.inf),
+    }
+    errors_list = []
+    for name, params in test_cases.items():
+        try:
+            BallisticMissile(params).build()
+            errors_list.append(f'{name}: did not raise ValueError.')
+        except ValueError:
+            pass
+    assert not errors_list, 'Errors occurred: \n{}'.format('\n'.join(errors_list))
+
+if __name__ == '__main__':
+    test_build_time_grid()
+    test_get_current_orientation_vectorized()
+    test_launch_stoptime_exceeds_time_to_target()
+    test_launch_stoptime_at_time_to_target()
+    test_batch_matches_single_missiles()
+    test_batch_trajectory_padding()
+    test_batch_invalid_inputs()
+    test_invalid_inputs()
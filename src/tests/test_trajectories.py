@@ -0,0 +1,137 @@
+"""
+Unit tests for trajectories.py.
+"""
+# Import packages
+from collections import OrderedDict
+from dataclasses import fields
+
+import numpy as np
+
+from ..trajectories import TRAJECTORY_DTYPE, TrajectoryArrays
+
+# Define test data shared by trajectory tests
+FIELD_NAMES = [
+    'time_sec', 'lat_deg', 'lon_deg', 'alt_km', 'bearing_deg', 'tilt_deg', 'roll_deg',
+]
+
+# Define helper functions
+def make_trajectory(
+    n_timesteps: int,
+    start_time_sec: float = 0.0,
+    dtype: np.dtype = TRAJECTORY_DTYPE,
+) -> TrajectoryArrays:
+    """Create a trajectory with distinct, deterministic values for each field."""
+    time_sec = start_time_sec + np.arange(n_timesteps, dtype=np.float64)
+    return TrajectoryArrays(
+        time_sec=time_sec,
+        **{
+            name:np.asarray(time_sec * 0.5 + idx, dtype=dtype)
+            for idx, name in enumerate(FIELD_NAMES[1:])
+        },
+    )
+
+def trajectory_from_ordered_dict(trajectory_dict: OrderedDict) -> TrajectoryArrays:
+    """Convert former OrderedDict trajectory format {time_sec:{field:value}}
+    to TrajectoryArrays (float64)."""
+    return TrajectoryArrays(
+        time_sec=np.array(list(trajectory_dict.keys()), dtype=np.float64),
+        **{
+            name:np.array(
+                [values[name] for values in trajectory_dict.values()],
+                dtype=np.float64,
+            )
+            for name in FIELD_NAMES[1:]
+        },
+    )
+
+# Define tests
+def test_len():
+    """Test that len returns the number of timesteps."""
+    errors_list = []
+    for n_timesteps in [0, 1, 151]:
+        trajectory = make_trajectory(n_timesteps)
+        if len(trajectory) != n_timesteps:
+            errors_list.append(f'Expected {n_timesteps} timesteps, got {len(trajectory)}.')
+    assert not errors_list, 'Errors occurred: \n{}'.format('\n'.join(errors_list))
+
+def test_concatenate():
+    """Test that concatenate joins each field in order and preserves dtypes."""
+    trajectories = [make_trajectory(3), make_trajectory(0), make_trajectory(5, 10.0)]
+    combined = TrajectoryArrays.concatenate(trajectories)
+    errors_list = []
+    if len(combined) != 8:
+        errors_list.append(f'Expected 8 timesteps, got {len(combined)}.')
+    for field in fields(TrajectoryArrays):
+        expected = np.concatenate(
+            [getattr(trajectory, field.name) for trajectory in trajectories]
+        )
+        actual = getattr(combined, field.name)
+        if not np.array_equal(actual, expected):
+            errors_list.append(f'{field.name} values differ.')
+        if actual.dtype != getattr(trajectories[0], field.name).dtype:
+            errors_list.append(f'{field.name} has dtype {actual.dtype}.')
+    assert not errors_list, 'Errors occurred: \n{}'.format('\n'.join(errors_list))
+
+def test_items_matches_ordered_dict_format():
+    """Test that items reproduces the former OrderedDict trajectory format
+    ({time_sec:{field:value}}, with Python floats) and round-trips losslessly.
+    """
+    trajectory = make_trajectory(4, dtype=np.float64)
+    trajectory_dict = OrderedDict(trajectory.items())
+    errors_list = []
+    if list(trajectory_dict.keys()) != trajectory.time_sec.tolist():
+        errors_list.append('Timestep keys differ from time_sec.')
+    for time_idx, (time_sec, values) in enumerate(trajectory_dict.items()):
+        if list(values.keys()) != FIELD_NAMES[1:]:
+            errors_list.append(f'Timestep {time_sec}: fields {list(values.keys())}.')
+        for name, value in values.items():
+            if type(value) is not float:
+                errors_list.append(f'Timestep {time_sec}: {name} is {type(value)}.')
+            if value != getattr(trajectory, name)[time_idx]:
+                errors_list.append(f'Timestep {time_sec}: {name} value differs.')
+    round_trip = trajectory_from_ordered_dict(trajectory_dict)
+    for name in FIELD_NAMES:
+        if not np.array_equal(getattr(round_trip, name), getattr(trajectory, name)):
+            errors_list.append(f'{name} differs after round trip.')
+    assert not errors_list, 'Errors occurred: \n{}'.format('\n'.join(errors_list))
+
+def test_to_records():
+    """Test that to_records returns one record per timestep with field names
+    and dtypes of the trajectory arrays."""
+    trajectory = make_trajectory(6)
+    records = trajectory.to_records()
+    errors_list = []
+    if len(records) != len(trajectory):
+        errors_list.append(f'Expected {len(trajectory)} records, got {len(records)}.')
+    if list(records.dtype.names) != FIELD_NAMES:
+        errors_list.append(f'Record fields {records.dtype.names}.')
+    for name in FIELD_NAMES:
+        if not np.array_equal(records[name], getattr(trajectory, name)):
+            errors_list.append(f'{name} values differ.')
+        if records[name].dtype != getattr(trajectory, name).dtype:
+            errors_list.append(f'{name} has dtype {records[name].dtype}.')
+    assert not errors_list, 'Errors occurred: \n{}'.format('\n'.join(errors_list))
+
+def test_to_dataframe():
+    """Test that to_dataframe returns one row per timestep with one column
+    per field (same values and dtypes)."""
+    trajectory = make_trajectory(6)
+    df = trajectory.to_dataframe()
+    errors_list = []
+    if len(df) != len(trajectory):
+        errors_list.append(f'Expected {len(trajectory)} rows, got {len(df)}.')
+    if list(df.columns) != FIELD_NAMES:
+        errors_list.append(f'DataFrame columns {list(df.columns)}.')
+    for name in FIELD_NAMES:
+        if not np.array_equal(df[name].to_numpy(), getattr(trajectory, name)):
+            errors_list.append(f'{name} values differ.')
+        if df[name].dtype != getattr(trajectory, name).dtype:
+            errors_list.append(f'{name} has dtype {df[name].dtype}.')
+    assert not errors_list, 'Errors occurred: \n{}'.format('\n'.join(errors_list))
+
+if __name__ == '__main__':
+    test_len()
+    test_concatenate()
+    test_items_matches_ordered_dict_format()
+    test_to_records()
+    test_to_dataframe()
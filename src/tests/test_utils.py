@@ -0,0 +1,32 @@
+"""
+Unit tests for utils.py.
+"""
+# Import packages
+import operator
+
+from ..utils import get_constants
+
+# Define tests
+def test_get_constants_read_only():
+    """Test that get_constants returns the same cached mapping on every call
+    and that the mapping cannot be modified.
+    """
+    constants = get_constants()
+    errors_list = []
+    if get_constants() is not constants:
+        errors_list.append('Constants are not cached.')
+    for name, mutate in {
+        'set item':lambda: operator.setitem(constants, 'EARTH_RADIUS_KM', 0),
+        'delete item':lambda: operator.delitem(constants, 'EARTH_RADIUS_KM'),
+    }.items():
+        try:
+            mutate()
+            errors_list.append(f'{name} did not raise TypeError.')
+        except TypeError:
+            pass
+    if get_constants()['EARTH_RADIUS_KM'] != 6378:
+        errors_list.append('EARTH_RADIUS_KM was modified.')
+    assert not errors_list, 'Errors occurred: \n{}'.format('\n'.join(errors_list))
+
+if __name__ == '__main__':
+    test_get_constants_read_only()
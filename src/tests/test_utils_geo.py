@@ -10,12 +10,38 @@ from ..utils_geo import (
     convert_lat_lon_alt_to_nvector,
     calculate_magnitude_dist_bt_vectors,
     calculate_great_circle_distance,
-    calculate_great_circle_distance_vec
+    calculate_great_circle_distance_vec,
+    calculate_great_circle_distance_and_bearing,
+    calculate_initial_bearing,
+    calculate_cross_track_distance,
+    determine_destination_coords,
 )
 
 # Get constants
 constants = get_constants()
 
+# Define test data shared by great-circle tests
+CITY_LATLON_DEG = {
+    'Denver':[39.7392, -104.9903],
+    'Amman':[31.9539, 35.9106],
+    'Sydney':[-33.8688, 151.2093],
+    'Santiago':[-33.4489, -70.6693],
+}
+CITY_DISTANCES_KM = {
+    'Denver_to_Amman':11076,
+    'Denver_to_Sydney':13398,
+    'Denver_to_Santiago':8865,
+    'Amman_to_Denver':11076,
+    'Amman_to_Sydney':14067,
+    'Amman_to_Santiago':13289,
+    'Sydney_to_Denver':13398,
+    'Sydney_to_Amman':14067,
+    'Sydney_to_Santiago':11340,
+    'Santiago_to_Denver':8865,
+    'Santiago_to_Amman':13289,
+    'Santiago_to_Sydney':11340,
+}
+
 # Define tests
 def test_convert_trig_to_compass_angle():
     """Test that convert_trig_to_compass_angle function correctly converts 
@@ -75,10 +101,10 @@ def test_convert_lat_lon_alt_to_nvector():
         if len(n_vector) != 3:
             errors_list.append(f'Normal vector for test case "{direction}" '+
                 f'contains {len(n_vector)} coordinates.')
-        if (
-            tuple([round(x, 10) for x in n_vector]) !=
-            tuple([constants['EARTH_RADIUS_KM'] * x for x in conversions_dict['nvector']])
-        ):
+        expected_n_vector = (
+            constants['EARTH_RADIUS_KM'] * np.asarray(conversions_dict['nvector'])
+        )
+        if not np.allclose(n_vector, expected_n_vector, rtol=0, atol=1e-10):
             errors_list.append(f'Incorrect conversion for test case "{direction}".')
     assert not errors_list, 'Errors occurred: \n{}'.format('\n'.join(errors_list))
 
@@ -109,29 +135,9 @@ def test_calculate_great_circle_distance():
     calculates the great circle distance between locations in all hemispheres.
     """
     margin_of_error_allowed = 0.002
-    latlon_deg_dict = {
-        'Denver':[39.7392, -104.9903],
-        'Amman':[31.9539, 35.9106],
-        'Sydney':[-33.8688, 151.2093],
-        'Santiago':[-33.4489, -70.6693],
-    }
-    distances_km_dict = {
-        'Denver_to_Amman':11076,
-        'Denver_to_Sydney':13398,
-        'Denver_to_Santiago':8865,
-        'Amman_to_Denver':11076,
-        'Amman_to_Sydney':14067,
-        'Amman_to_Santiago':13289,
-        'Sydney_to_Denver':13398,
-        'Sydney_to_Amman':14067,
-        'Sydney_to_Santiago':11340,
-        'Santiago_to_Denver':8865,
-        'Santiago_to_Amman':13289,
-        'Santiago_to_Sydney':11340,
-    }
     errors_list = []
-    for origin_city, origin_latlon_deg in latlon_deg_dict.items():
-        for dest_city, dest_latlon_deg in latlon_deg_dict.items():
+    for origin_city, origin_latlon_deg in CITY_LATLON_DEG.items():
+        for dest_city, dest_latlon_deg in CITY_LATLON_DEG.items():
             if origin_city == dest_city:
                 continue
             else:
@@ -142,7 +148,7 @@ def test_calculate_great_circle_distance():
                     dest_lon_deg=dest_latlon_deg[1],
                 )
                 route_key = f'{origin_city}_to_{dest_city}'
-                actual_dist_km = distances_km_dict[route_key]
+                actual_dist_km = CITY_DISTANCES_KM[route_key]
                 margin_of_error_actual = (
                     abs(calculated_dist_km - actual_dist_km) / actual_dist_km
                 )
@@ -155,51 +161,140 @@ def test_calculate_great_circle_distance():
 
 def test_calculate_great_circle_distance_vec():
     """Test that calculate_great_circle_distance_vec function correctly 
-    calculates the great circle distance between locations in all hemispheres.
+    calculates the great circle distance between locations in all hemispheres
+    (all city pairs computed in one broadcast call as a distance matrix).
     """
     margin_of_error_allowed = 0.002
-    latlon_deg_dict = {
-        'Denver':[39.7392, -104.9903],
-        'Amman':[31.9539, 35.9106],
-        'Sydney':[-33.8688, 151.2093],
-        'Santiago':[-33.4489, -70.6693],
-    }
-    distances_km_dict = {
-        'Denver_to_Amman':11076,
-        'Denver_to_Sydney':13398,
-        'Denver_to_Santiago':8865,
-        'Amman_to_Denver':11076,
-        'Amman_to_Sydney':14067,
-        'Amman_to_Santiago':13289,
-        'Sydney_to_Denver':13398,
-        'Sydney_to_Amman':14067,
-        'Sydney_to_Santiago':11340,
-        'Santiago_to_Denver':8865,
-        'Santiago_to_Amman':13289,
-        'Santiago_to_Sydney':11340,
-    }
+    cities = list(CITY_LATLON_DEG)
+    lat_deg, lon_deg = np.array(list(CITY_LATLON_DEG.values())).T
+    distances_km = np.array([
+        [CITY_DISTANCES_KM.get(f'{origin}_to_{dest}', 0) for dest in cities]
+        for origin in cities
+    ])
+    calculated_dist_km = calculate_great_circle_distance_vec(
+        origin_lat_deg=lat_deg[:, None],
+        origin_lon_deg=lon_deg[:, None],
+        dest_lat_deg=lat_deg[None, :],
+        dest_lon_deg=lon_deg[None, :],
+    )
+    off_diagonal = ~np.eye(len(cities), dtype=bool)
+    margin_of_error_actual = np.abs(
+        calculated_dist_km[off_diagonal] - distances_km[off_diagonal]
+    ) / distances_km[off_diagonal]
+    errors_list = [
+        f'Calculated distance for {cities[origin_idx]} to {cities[dest_idx]} '+
+        f'exceeds a margin of error of {margin_of_error_allowed * 100}%.'
+        for (origin_idx, dest_idx), margin in zip(
+            np.argwhere(off_diagonal), margin_of_error_actual,
+        )
+        if margin > margin_of_error_allowed
+    ]
+    if not np.allclose(np.diag(calculated_dist_km), 0):
+        errors_list.append('Nonzero distance from a city to itself.')
+    assert not errors_list, 'Errors occurred: \n{}'.format('\n'.join(errors_list))
+
+def test_calculate_great_circle_distance_and_bearing():
+    """Test that calculate_great_circle_distance_and_bearing function returns
+    the same distance and bearing as the separate haversine distance and
+    initial bearing functions.
+    """
     errors_list = []
-    for origin_city, origin_latlon_deg in latlon_deg_dict.items():
-        for dest_city, dest_latlon_deg in latlon_deg_dict.items():
+    for origin_city, origin_latlon_deg in CITY_LATLON_DEG.items():
+        for dest_city, dest_latlon_deg in CITY_LATLON_DEG.items():
             if origin_city == dest_city:
                 continue
-            else:
-                calculated_dist_km = calculate_great_circle_distance_vec(
-                    origin_lat_deg=origin_latlon_deg[0],
-                    origin_lon_deg=origin_latlon_deg[1],
-                    dest_lat_deg=dest_latlon_deg[0],
-                    dest_lon_deg=dest_latlon_deg[1],
-                )
-                route_key = f'{origin_city}_to_{dest_city}'
-                actual_dist_km = distances_km_dict[route_key]
-                margin_of_error_actual = (
-                    abs(calculated_dist_km - actual_dist_km) / actual_dist_km
-                )
-                if margin_of_error_actual > margin_of_error_allowed:
-                    errors_list.append('Calculated distance for '+
-                    f'{route_key.replace("_", " ")} exceeds a margin of error '+
-                    f'of {margin_of_error_allowed * 100}%.'
-                )
+            dist_km, bearing_deg = calculate_great_circle_distance_and_bearing(
+                *origin_latlon_deg, *dest_latlon_deg,
+            )
+            if not np.isclose(dist_km, calculate_great_circle_distance(
+                *origin_latlon_deg, *dest_latlon_deg,
+            )):
+                errors_list.append(f'Distance differs for {origin_city} to {dest_city}.')
+            if not np.isclose(bearing_deg, calculate_initial_bearing(
+                *origin_latlon_deg, *dest_latlon_deg,
+            )):
+                errors_list.append(f'Bearing differs for {origin_city} to {dest_city}.')
+    assert not errors_list, 'Errors occurred: \n{}'.format('\n'.join(errors_list))
+
+def test_determine_destination_coords_vectorized():
+    """Test that determine_destination_coords function returns the same
+    destination coordinates for an array of distances as for each distance
+    computed individually.
+    """
+    origin_lat_deg, origin_lon_deg, bearing_deg = 39.7392, -104.9903, 357.7
+    distances_km = np.linspace(0, 500, 51)
+    lat_arr, lon_arr = determine_destination_coords(
+        origin_lat_deg=origin_lat_deg,
+        origin_lon_deg=origin_lon_deg,
+        distance_km=distances_km,
+        initial_bearing_deg=bearing_deg,
+    )
+    errors_list = []
+    for idx, distance_km in enumerate(distances_km):
+        lat_deg, lon_deg = determine_destination_coords(
+            origin_lat_deg=origin_lat_deg,
+            origin_lon_deg=origin_lon_deg,
+            distance_km=distance_km,
+            initial_bearing_deg=bearing_deg,
+        )
+        if not np.isclose(lat_arr[idx], lat_deg) or not np.isclose(lon_arr[idx], lon_deg):
+            errors_list.append(f'Vectorized result differs for {distance_km} km.')
+    assert not errors_list, 'Errors occurred: \n{}'.format('\n'.join(errors_list))
+
+def test_calculate_cross_track_distance_vectorized():
+    """Test that calculate_cross_track_distance function returns the same
+    cross-track distances for arrays of cross-track locations as for each
+    location computed individually, and that points on the path have zero
+    cross-track distance.
+    """
+    origin_latlon_deg = [39.7392, -104.9903] # Denver
+    dest_latlon_deg = [31.9539, 35.9106] # Amman
+    cross_lat_deg = np.array([-33.8688, -33.4489, 45.0, 60.0])
+    cross_lon_deg = np.array([151.2093, -70.6693, -30.0, 10.0])
+    dist_arr_km = calculate_cross_track_distance(
+        *origin_latlon_deg, *dest_latlon_deg, cross_lat_deg, cross_lon_deg,
+    )
+    errors_list = []
+    for idx in range(len(cross_lat_deg)):
+        dist_km = calculate_cross_track_distance(
+            *origin_latlon_deg, *dest_latlon_deg,
+            cross_lat_deg[idx], cross_lon_deg[idx],
+        )
+        if not np.isclose(dist_arr_km[idx], dist_km):
+            errors_list.append(f'Vectorized result differs for index {idx}.')
+    on_path_latlon_deg = determine_destination_coords(
+        *origin_latlon_deg,
+        distance_km=1000,
+        initial_bearing_deg=calculate_initial_bearing(
+            *origin_latlon_deg, *dest_latlon_deg,
+        ),
+    )
+    on_path_dist_km = calculate_cross_track_distance(
+        *origin_latlon_deg, *dest_latlon_deg, *on_path_latlon_deg,
+    )
+    if abs(on_path_dist_km) > 1e-6:
+        errors_list.append('Nonzero cross-track distance for point on path.')
+    assert not errors_list, 'Errors occurred: \n{}'.format('\n'.join(errors_list))
+
+def test_calculate_magnitude_dist_bt_nvectors_vectorized():
+    """Test that calculate_magnitude_dist_bt_vectors function returns the same
+    distances for n-vectors of arrays of points as for each point individually.
+    """
+    lat_deg = np.array([39.7392, 31.9539, -33.8688, -33.4489])
+    lon_deg = np.array([-104.9903, 35.9106, 151.2093, -70.6693])
+    alt_km = np.array([0.0, 10.0, 100.0, 1000.0])
+    origin_vector = convert_lat_lon_alt_to_nvector(0.0, 0.0)
+    dist_arr_km = calculate_magnitude_dist_bt_vectors(
+        origin_vector, convert_lat_lon_alt_to_nvector(lat_deg, lon_deg, alt_km),
+    )
+    errors_list = []
+    for idx in range(len(lat_deg)):
+        dist_km = calculate_magnitude_dist_bt_vectors(
+            origin_vector,
+            convert_lat_lon_alt_to_nvector(lat_deg[idx], lon_deg[idx], alt_km[idx]),
+        )
+        if not np.isclose(dist_arr_km[idx], dist_km):
+            errors_list.append(f'Vectorized result differs for index {idx}.')
     assert not errors_list, 'Errors occurred: \n{}'.format('\n'.join(errors_list))
 
 if __name__ == '__main__':
@@ -208,3 +303,7 @@ if __name__ == '__main__':
     test_calculate_magnitude_dist_bt_vectors()
     test_calculate_great_circle_distance()
     test_calculate_great_circle_distance_vec()
+    test_calculate_great_circle_distance_and_bearing()
+    test_determine_destination_coords_vectorized()
+    test_calculate_cross_track_distance_vectorized()
+    test_calculate_magnitude_dist_bt_nvectors_vectorized()
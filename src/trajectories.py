@@ -0,0 +1,110 @@
+"""
+Missile trajectory data containers.
+
+Contents:
+    Public classes:
+        TrajectoryArrays
+
+    Constants:
+        TRAJECTORY_DTYPE
+"""
+# Import packages
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING, Dict, Iterator, Sequence, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Define constants
+TRAJECTORY_DTYPE = np.float32 # ~7 significant digits (altitude and angles)
+
+# Define classes
+@dataclass
+class TrajectoryArrays():
+    """Missile position/orientation for each timestep, stored as one array
+    per field (structure-of-arrays). Time, latitude, and longitude are
+    stored as float64 (float32 longitude resolution is ~1 m); all other
+    fields default to TRAJECTORY_DTYPE.
+
+    Attributes:
+        time_sec: elapsed time since launch (seconds)
+        lat_deg: latitude (degrees)
+        lon_deg: longitude (degrees)
+        alt_km: altitude (km)
+        bearing_deg: heading (degrees, clockwise from North)
+        tilt_deg: tilt (degrees)
+        roll_deg: roll (degrees)
+
+    Methods:
+        concatenate
+        items
+        to_records
+        to_dataframe
+    """
+    time_sec: np.ndarray
+    lat_deg: np.ndarray
+    lon_deg: np.ndarray
+    alt_km: np.ndarray
+    bearing_deg: np.ndarray
+    tilt_deg: np.ndarray
+    roll_deg: np.ndarray
+
+    def __len__(self) -> int:
+        """Return number of timesteps."""
+        return len(self.time_sec)
+
+    @classmethod
+    def concatenate(
+        cls,
+        trajectories: Sequence['TrajectoryArrays'],
+    ) -> 'TrajectoryArrays':
+        """Concatenate trajectories (e.g., from a fleet of missiles) into a
+        single TrajectoryArrays, with one contiguous array copy per field
+        (no intermediate DataFrames).
+
+        Arguments
+            trajectories: sequence of TrajectoryArrays
+
+        Returns
+            TrajectoryArrays containing all timesteps of all trajectories, in order
+        """
+        return cls(**{
+            field.name:np.concatenate(
+                [getattr(trajectory, field.name) for trajectory in trajectories]
+            )
+            for field in fields(cls)
+        })
+
+    def items(self) -> Iterator[Tuple[float, Dict]]:
+        """Iterate over timesteps as (time_sec, {field:value}) pairs, matching
+        the former OrderedDict-of-dicts trajectory format (for consumers
+        that have not been converted to index arrays directly).
+
+        Returns
+            iterator of (time_sec, dict of position/orientation values) tuples
+        """
+        names = [field.name for field in fields(self) if field.name != 'time_sec']
+        columns = [getattr(self, name).tolist() for name in names]
+        for time_sec, values in zip(self.time_sec.tolist(), zip(*columns)):
+            yield time_sec, dict(zip(names, values))
+
+    def to_records(self) -> np.recarray:
+        """Convert trajectory arrays to a NumPy record array with one record
+        per timestep (no pandas dependency)."""
+        return np.rec.fromarrays(
+            [getattr(self, field.name) for field in fields(self)],
+            names=[field.name for field in fields(self)],
+        )
+
+    def to_dataframe(self) -> 'pd.DataFrame':
+        """Convert trajectory arrays to DataFrame with one row per timestep.
+        Columns are built directly from the arrays (no copy where possible).
+        pandas is imported on first use so that simulation code does not
+        depend on it."""
+        import pandas as pd
+        return pd.DataFrame(
+            {field.name:getattr(self, field.name) for field in fields(self)},
+            copy=False,
+        )
@@ -1,31 +1,33 @@
 """Utility functions."""
 
 # Import packages
+from functools import lru_cache
 import json
-from typing import Dict
-
-import numpy as np
+import math
+from types import MappingProxyType
+from typing import Dict, Mapping
 
 # Constants
-def get_constants() -> Dict:
-    """Calculate and return dictionary of constants."""
+@lru_cache(maxsize=1)
+def get_constants() -> Mapping:
+    """Calculate and return read-only mapping of constants. Computed once and
+    cached; the mapping is shared by all callers, so it cannot be modified."""
     EARTH_RADIUS_KM = 6378
     EARTH_MASS_KG = 5.9722 * (10**24)
     GRAV_CONSTANT_M3_PER_KG_S2 = 6.673 * (10**-11)
     EARTH_STD_GRAV_PARAM_M3_PER_S2 = GRAV_CONSTANT_M3_PER_KG_S2 * EARTH_MASS_KG
     EARTH_ESCAPE_VELOCITY_KM_PER_S = (
-        np.sqrt(2 * EARTH_STD_GRAV_PARAM_M3_PER_S2 / (EARTH_RADIUS_KM*1000)) 
+        math.sqrt(2 * EARTH_STD_GRAV_PARAM_M3_PER_S2 / (EARTH_RADIUS_KM*1000)) 
         / 1000
     )
-    return {
+    return MappingProxyType({
         'EARTH_RADIUS_KM':EARTH_RADIUS_KM,
         'EARTH_MASS_KG':EARTH_MASS_KG,
         'GRAVITY_ACCEL_KM_PER_S2':(-0.0098),
         'GRAV_CONSTANT_M3_PER_KG_S2':GRAV_CONSTANT_M3_PER_KG_S2,
         'EARTH_STD_GRAV_PARAM_M3_PER_S2':EARTH_STD_GRAV_PARAM_M3_PER_S2,
         'EARTH_ESCAPE_VELOCITY_KM_PER_S':EARTH_ESCAPE_VELOCITY_KM_PER_S,
-        'KML_TIME_FORMAT':'%Y-%m-%dT%H:%M:%SZ',
-    }
+    })
 
 ## I/O
 def load_json(filepath:str) -> Dict:
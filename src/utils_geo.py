@@ -6,6 +6,8 @@ import numpy as np
 
 # Define constants
 EARTH_RADIUS_KM = 6378
+RAD_TO_DEG = 180 / np.pi
+DEG_TO_RAD = np.pi / 180
 
 # Define functions
 def km_to_miles(km: float) -> float:
@@ -22,11 +24,11 @@ def meters_to_km(meters: float) -> float:
 
 def deg_to_rad(degrees: float) -> float:
     """Converts angle in degrees to radians."""
-    return degrees * np.pi / 180
+    return degrees * DEG_TO_RAD
 
 def rad_to_deg(radians: float) -> float:
     """Converts angle in radians to degrees."""
-    return radians * 180 / np.pi
+    return radians * RAD_TO_DEG
 
 def convert_trig_to_compass_angle(trig_angle: float, radians: bool = True):
     """Converts a trigonometric angle (measured counterclockwise from East) 
@@ -53,6 +55,8 @@ def convert_lat_lon_alt_to_nvector(lat_deg: float, lon_deg: float, alt_km: float
     coordinate system is used (e.g., positive x-axis points toward 0 degrees
     North, 0 degrees East; positive y-axis points toward 0 degrees North, 90
     degrees East; positive z-axis points toward 90 degrees North).
+    Arguments may be arrays, in which case each component is an array (one
+    element per point).
     Source: https://www.movable-type.co.uk/scripts/latlong-vectors.html.
 
     Arguments
@@ -64,9 +68,11 @@ def convert_lat_lon_alt_to_nvector(lat_deg: float, lon_deg: float, alt_km: float
         n_vector: orthogonal vector <x, y, z>
     """
     lat_rad, lon_rad = deg_to_rad(lat_deg), deg_to_rad(lon_deg)
-    x = (EARTH_RADIUS_KM + alt_km) * np.cos(lat_rad) * np.cos(lon_rad)
-    y = (EARTH_RADIUS_KM + alt_km) * np.cos(lat_rad) * np.sin(lon_rad)
-    z = (EARTH_RADIUS_KM + alt_km) * np.sin(lat_rad)
+    radius_km = EARTH_RADIUS_KM + alt_km
+    radius_cos_lat = radius_km * np.cos(lat_rad)
+    x = radius_cos_lat * np.cos(lon_rad)
+    y = radius_cos_lat * np.sin(lon_rad)
+    z = radius_km * np.sin(lat_rad)
     return (x, y, z)
 
 def convert_nvector_to_lat_lon(nvector: Tuple[float, float, float],
@@ -94,15 +100,18 @@ def calculate_magnitude_dist_bt_vectors(
     vector2: Tuple[float, float, float],
 ) -> float:
     """Calculate the magnitude of the Euclidean distance between two vectors
-    in R3.
+    in R3. Components may be arrays (e.g., n-vectors of many points from
+    convert_lat_lon_alt_to_nvector), in which case distances are computed
+    elementwise.
 
     Arguments
         vector1: first vector with components <x, y, z>
         vector2: second vector with components <x, y, z>
     """
-    squared_dist = 0
-    for i in np.arange(len(vector1)):
-        squared_dist += (vector2[i] - vector1[i])**2
+    squared_dist = sum(
+        (component2 - component1)**2
+        for component1, component2 in zip(vector1, vector2)
+    )
     return np.sqrt(squared_dist)
 
 def calculate_great_circle_distance(
@@ -133,7 +142,8 @@ def calculate_great_circle_distance(
         np.sin(delta_lat_rad/2) ** 2
         + np.cos(origin_lat_rad) * np.cos(dest_lat_rad) * np.sin(delta_lon_rad/2) ** 2
     )
-    ang_dist_rad = 2 * np.arctan2(np.sqrt(a), np.sqrt(1-a))
+    # Clip guards against rounding pushing a marginally above 1 (antipodal points)
+    ang_dist_rad = 2 * np.arcsin(np.sqrt(np.minimum(a, 1)))
     distance_km = EARTH_RADIUS_KM * ang_dist_rad
     return distance_km
 
@@ -142,6 +152,8 @@ def calculate_great_circle_distance_vec(
     dest_lat_deg: float, dest_lon_deg: float,
 ) -> float:
     """Calculate great-circle distance between two points using vectors.
+    Arguments may be arrays (broadcast against each other), e.g. to compute a
+    pairwise distance matrix in a single call.
     Source: https://www.movable-type.co.uk/scripts/latlong-vectors.html.
 
     Arguments
@@ -156,14 +168,53 @@ def calculate_great_circle_distance_vec(
     # Convert lat/lon coordinates to vectors
     origin_vector = convert_lat_lon_alt_to_nvector(origin_lat_deg, origin_lon_deg)
     dest_vector = convert_lat_lon_alt_to_nvector(dest_lat_deg, dest_lon_deg)
-    # Calculate distance
-    ang_dist_rad = np.arctan2(
-        np.linalg.norm(np.cross(origin_vector, dest_vector)),
-        np.dot(origin_vector, dest_vector)
+    # Calculate distance (cross/dot products written per component so that
+    # array inputs broadcast)
+    ox, oy, oz = origin_vector
+    dx, dy, dz = dest_vector
+    cross_norm = np.sqrt(
+        (oy*dz - oz*dy)**2 + (oz*dx - ox*dz)**2 + (ox*dy - oy*dx)**2
     )
+    ang_dist_rad = np.arctan2(cross_norm, ox*dx + oy*dy + oz*dz)
     distance_km = EARTH_RADIUS_KM * ang_dist_rad
     return distance_km
 
+def calculate_great_circle_distance_and_bearing(
+    origin_lat_deg: float, origin_lon_deg: float,
+    dest_lat_deg: float, dest_lon_deg: float,
+) -> Tuple[float, float]:
+    """Calculate great-circle distance (using Vincenty's atan2 form) and
+    forward azimuth/initial bearing between two points in a single pass.
+    The bearing's x and y terms are also the components of the cross-product
+    magnitude in Vincenty's formula, so the trig terms are shared.
+    Source: https://www.movable-type.co.uk/scripts/latlong.html.
+
+    Arguments
+        origin_lat_deg: float latitude of origin location in decimal degrees
+        origin_lon_deg: float longitude of origin location in decimal degrees
+        dest_lat_deg: float latitude of destination location in decimal degrees
+        dest_lon_deg: float longitude of destination location in decimal degrees
+
+    Returns
+        (distance_km, bearing_deg): distance in kilometers and initial bearing
+            in degrees
+    """
+    # Convert degrees to radians
+    origin_lat_rad = deg_to_rad(origin_lat_deg)
+    dest_lat_rad = deg_to_rad(dest_lat_deg)
+    delta_lon_rad = deg_to_rad(dest_lon_deg) - deg_to_rad(origin_lon_deg)
+    # Shared trig terms
+    sin_origin_lat, cos_origin_lat = np.sin(origin_lat_rad), np.cos(origin_lat_rad)
+    sin_dest_lat, cos_dest_lat = np.sin(dest_lat_rad), np.cos(dest_lat_rad)
+    cos_delta_lon = np.cos(delta_lon_rad)
+    x = cos_origin_lat * sin_dest_lat - sin_origin_lat * cos_dest_lat * cos_delta_lon
+    y = np.sin(delta_lon_rad) * cos_dest_lat
+    z = sin_origin_lat * sin_dest_lat + cos_origin_lat * cos_dest_lat * cos_delta_lon
+    # Calculate distance and bearing
+    distance_km = EARTH_RADIUS_KM * np.arctan2(np.sqrt(x**2 + y**2), z)
+    bearing_deg = (rad_to_deg(np.arctan2(y, x)) + 360) % 360
+    return (distance_km, bearing_deg)
+
 def calculate_initial_bearing(
     origin_lat_deg: float, origin_lon_deg: float,
     dest_lat_deg: float, dest_lon_deg: float,
@@ -177,20 +228,45 @@ def calculate_initial_bearing(
         dest_lat_deg: float latitude of destination location in decimal degrees
         dest_lon_deg: float longitude of destination location in decimal degrees
 
+    Returns
+        bearing_deg: float initial bearing in degrees
+    """
+    dest_lat_rad = deg_to_rad(dest_lat_deg)
+    return calculate_initial_bearing_precomputed(
+        origin_lat_deg=origin_lat_deg,
+        origin_lon_deg=origin_lon_deg,
+        sin_dest_lat=np.sin(dest_lat_rad),
+        cos_dest_lat=np.cos(dest_lat_rad),
+        dest_lon_rad=deg_to_rad(dest_lon_deg),
+    )
+
+def calculate_initial_bearing_precomputed(
+    origin_lat_deg: float, origin_lon_deg: float,
+    sin_dest_lat: float, cos_dest_lat: float, dest_lon_rad: float,
+) -> float:
+    """Calculate forward azimuth/initial bearing between two points, in degrees,
+    using precomputed trigonometric terms of the destination (e.g., a fixed
+    aimpoint evaluated from many origins).
+
+    Arguments
+        origin_lat_deg: float latitude of origin location in decimal degrees
+        origin_lon_deg: float longitude of origin location in decimal degrees
+        sin_dest_lat: float sine of destination latitude
+        cos_dest_lat: float cosine of destination latitude
+        dest_lon_rad: float longitude of destination location in radians
+
     Returns
         bearing_deg: float initial bearing in degrees
     """
     # Convert degrees to radians
     origin_lat_rad = deg_to_rad(origin_lat_deg)
     origin_lon_rad = deg_to_rad(origin_lon_deg)
-    dest_lat_rad = deg_to_rad(dest_lat_deg)
-    dest_lon_rad = deg_to_rad(dest_lon_deg)
     # Calculate bearing
     delta_lon_rad = dest_lon_rad - origin_lon_rad
-    x = (np.cos(origin_lat_rad) * np.sin(dest_lat_rad) 
-        - np.sin(origin_lat_rad) * np.cos(dest_lat_rad) * np.cos(delta_lon_rad)
+    x = (np.cos(origin_lat_rad) * sin_dest_lat
+        - np.sin(origin_lat_rad) * cos_dest_lat * np.cos(delta_lon_rad)
     )
-    y = np.sin(delta_lon_rad) * np.cos(dest_lat_rad)
+    y = np.sin(delta_lon_rad) * cos_dest_lat
     theta = np.arctan2(y, x)
     bearing_deg = (rad_to_deg(theta) + 360) % 360
     return bearing_deg
@@ -201,6 +277,8 @@ def determine_destination_coords(
 ) -> Tuple[float, float]:
     """Determine the latitude and longitude of a destination point given an
     initial latitude, longitude, and bearing (clockwise from 0 degrees North).
+    All arguments may be NumPy arrays (broadcast elementwise), so a full
+    trajectory can be computed in a single vectorized call.
     Source: https://www.movable-type.co.uk/scripts/latlong.html.
     
     Arguments
@@ -214,17 +292,48 @@ def determine_destination_coords(
     """
     # Convert degrees to radians
     origin_lat_rad = deg_to_rad(origin_lat_deg)
-    origin_lon_rad = deg_to_rad(origin_lon_deg)
     bearing_rad = deg_to_rad(initial_bearing_deg)
+    return determine_destination_coords_precomputed(
+        sin_origin_lat=np.sin(origin_lat_rad),
+        cos_origin_lat=np.cos(origin_lat_rad),
+        origin_lon_rad=deg_to_rad(origin_lon_deg),
+        sin_bearing=np.sin(bearing_rad),
+        cos_bearing=np.cos(bearing_rad),
+        distance_km=distance_km,
+    )
+
+def determine_destination_coords_precomputed(
+    sin_origin_lat: float, cos_origin_lat: float, origin_lon_rad: float,
+    sin_bearing: float, cos_bearing: float, distance_km: float,
+) -> Tuple[float, float]:
+    """Determine the latitude and longitude of a destination point using
+    precomputed trigonometric terms of the origin and bearing, so repeated
+    calls from a fixed origin along a fixed bearing (e.g., every timestep of
+    a trajectory) only evaluate the distance-dependent terms. distance_km may
+    be a NumPy array.
+
+    Arguments
+        sin_origin_lat: float sine of origin latitude
+        cos_origin_lat: float cosine of origin latitude
+        origin_lon_rad: float longitude of origin location in radians
+        sin_bearing: float sine of bearing from origin to destination
+        cos_bearing: float cosine of bearing from origin to destination
+        distance_km: float distance in km from origin to destination
+
+    Returns
+        dest_lat_deg, dest_lon_deg: destination latitude/longitude (decimal degrees)
+    """
     # Determine latitude/longitude of destination
     ang_dist_rad = distance_km / EARTH_RADIUS_KM
-    dest_lat_rad = np.arcsin(np.sin(origin_lat_rad) * np.cos(ang_dist_rad)
-        + np.cos(origin_lat_rad) * np.sin(ang_dist_rad) * np.cos(bearing_rad)
+    sin_ang_dist = np.sin(ang_dist_rad)
+    cos_ang_dist = np.cos(ang_dist_rad)
+    dest_lat_rad = np.arcsin(sin_origin_lat * cos_ang_dist
+        + cos_origin_lat * sin_ang_dist * cos_bearing
     )
     dest_lon_rad = (origin_lon_rad 
         + np.arctan2(
-            np.sin(bearing_rad) * np.sin(ang_dist_rad) * np.cos(origin_lat_rad),
-            np.cos(ang_dist_rad) - np.sin(origin_lat_rad) * np.sin(dest_lat_rad)
+            sin_bearing * sin_ang_dist * cos_origin_lat,
+            cos_ang_dist - sin_origin_lat * np.sin(dest_lat_rad)
         )
     )
     # Convert radians to degrees
@@ -256,13 +365,13 @@ def determine_square_coords(
     angle_rad_list = [(((n*2+1)/4)*np.pi + rotation_radians) for n in np.arange(4)]
     for angle_rad in angle_rad_list:
         bearing_rad = convert_trig_to_compass_angle(angle_rad, radians=True)
-        latlon_list = determine_destination_coords(
+        corner_lat_deg, corner_lon_deg = determine_destination_coords(
             origin_lat_deg=origin_lat_deg,
             origin_lon_deg=origin_lon_deg,
             distance_km=meters_to_km(dist_origin_to_corner_meters),
             initial_bearing_deg=rad_to_deg(bearing_rad),
         )
-        coords_list.append((latlon_list[1], latlon_list[0])) # Longitude first for simplekml
+        coords_list.append((corner_lon_deg, corner_lat_deg)) # Longitude first for simplekml
     return coords_list
 
 def calculate_cross_track_distance(
@@ -271,7 +380,9 @@ def calculate_cross_track_distance(
     cross_lat_deg: float, cross_lon_deg: float,
 ) -> float:
     """Calculate shortest distance from a third point to a great-circle path 
-    between origin and destination points, in kilometers.
+    between origin and destination points, in kilometers. Cross-track
+    latitude and longitude may be arrays (e.g., many candidate interceptor
+    locations), in which case all distances are computed in one vectorized call.
     Source: https://www.movable-type.co.uk/scripts/latlong.html.    
     
     Arguments
@@ -285,7 +396,7 @@ def calculate_cross_track_distance(
     Returns
         distance_km: float cross-track distance in kilometers
     """
-    # Calculate initial bearing between origin/destination and origin/cross location
+    # Calculate initial bearing between origin/destination
     bearing_origin_dest_rad = deg_to_rad(
         calculate_initial_bearing(
             origin_lat_deg=origin_lat_deg,
@@ -294,21 +405,16 @@ def calculate_cross_track_distance(
             dest_lon_deg=dest_lon_deg,
         )
     )
-    bearing_origin_cross_rad = deg_to_rad(
-        calculate_initial_bearing(
+    # Calculate distance and initial bearing between origin/cross location
+    dist_origin_to_cross_km, bearing_origin_cross_deg = (
+        calculate_great_circle_distance_and_bearing(
             origin_lat_deg=origin_lat_deg,
             origin_lon_deg=origin_lon_deg,
             dest_lat_deg=cross_lat_deg,
             dest_lon_deg=cross_lon_deg,
         )
     )
-    # Calculate angular distance from origin to cross location
-    dist_origin_to_cross_km = calculate_great_circle_distance(
-        origin_lat_deg=origin_lat_deg,
-        origin_lon_deg=origin_lon_deg,
-        dest_lat_deg=cross_lat_deg,
-        dest_lon_deg=cross_lon_deg,
-        )
+    bearing_origin_cross_rad = deg_to_rad(bearing_origin_cross_deg)
     ang_dist_origin_cross_rad = dist_origin_to_cross_km / EARTH_RADIUS_KM
     # Calculate cross-track distance
     distance_km = np.arcsin(
@@ -30,11 +30,10 @@ def save_kmz(
             kml.addfile(os.path.join(attachment_dir, file))
     elif attachment_dir is not None and attachment_suffix_list:
         for file in os.listdir(attachment_dir):
-            file_suffix = file.split('.', expand=True)[-1]
+            file_suffix = file.split('.')[-1]
             if file_suffix in attachment_suffix_list:
                 kml.addfile(os.path.join(attachment_dir, file))
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    os.makedirs(output_dir, exist_ok=True) # safe when groups save concurrently
     kml.savekmz(os.path.join(output_dir, f'{output_file_name}.kmz'))
     
 def create_kml_point_style(
@@ -98,14 +97,14 @@ def add_kml_point(
     Returns
         kml_folder: simplekml folder with newly added point object
     """
+    # Pass attributes to constructor (avoids lazy property object creation)
     pnt = kml_folder.newpoint(
         name=pnt_label,
-        coords=[(lon_deg, lat_deg, alt_meters)]
+        coords=[(lon_deg, lat_deg, alt_meters)],
+        timespan=simplekml.TimeSpan(begin=timespan_begin, end=timespan_end),
+        altitudemode=simplekml.AltitudeMode.relativetoground,
     )
     pnt.style = style
-    pnt.timespan.begin = timespan_begin
-    pnt.timespan.end = timespan_end
-    pnt.altitudemode = simplekml.AltitudeMode.relativetoground
     return kml_folder
 
 def add_kml_linestring(
@@ -129,19 +128,20 @@ def add_kml_linestring(
         timespan_begin: string (in KML format) indicating linestring start time
         timespan_end: string (in KML format) indicating linestring end time
         close_linestring: flag if linestring should connect from last point
-            to first point in lon_lat_alt_list
+            to first point in lon_lat_alt_list (input list is not modified)
     
     Returns
         kml_folder: simplekml folder with newly added linestring object
     """
-    linestring = kml_folder.newlinestring(name=linestring_label)
     if close_linestring:
-        lon_lat_alt_list.append(lon_lat_alt_list[0])
-    linestring.coords = lon_lat_alt_list
+        lon_lat_alt_list = [*lon_lat_alt_list, lon_lat_alt_list[0]]
+    linestring = kml_folder.newlinestring(
+        name=linestring_label,
+        coords=lon_lat_alt_list,
+        timespan=simplekml.TimeSpan(begin=timespan_begin, end=timespan_end),
+        altitudemode=simplekml.AltitudeMode.relativetoground,
+    )
     linestring.style = style
-    linestring.timespan.begin = timespan_begin
-    linestring.timespan.end = timespan_end
-    linestring.altitudemode = simplekml.AltitudeMode.relativetoground
     return kml_folder
 
 def add_kml_circle_linestring(
@@ -169,23 +169,20 @@ def add_kml_circle_linestring(
     Returns
         kml_folder: simplekml folder with newly added linestring object
     """
-    linestring = kml_folder.newlinestring(name=linestring_label)
-    coords_list = []
-    for angle_deg in np.arange(361):
-        latlon_deg = determine_destination_coords(
-            origin_lat_deg=origin_lat_deg,
-            origin_lon_deg=origin_lon_deg,
-            distance_km=radius_km,
-            angle_deg=angle_deg,
-        )
-        coords_list.append(
-            (latlon_deg[1], latlon_deg[0]) # Longitude first for simplekml
-        ) 
-    linestring.coords = coords_list
+    # Compute all points on circle in one vectorized call
+    lat_deg, lon_deg = determine_destination_coords(
+        origin_lat_deg=origin_lat_deg,
+        origin_lon_deg=origin_lon_deg,
+        distance_km=radius_km,
+        initial_bearing_deg=np.arange(361),
+    )
+    linestring = kml_folder.newlinestring(
+        name=linestring_label,
+        coords=list(zip(lon_deg, lat_deg)), # Longitude first for simplekml
+        timespan=simplekml.TimeSpan(begin=timespan_begin, end=timespan_end),
+        altitudemode=simplekml.AltitudeMode.relativetoground,
+    )
     linestring.style = style
-    linestring.timespan.begin = timespan_begin
-    linestring.timespan.end = timespan_end
-    linestring.altitudemode = simplekml.AltitudeMode.relativetoground
     return kml_folder
     #TODO: streamline by calling add_kml_linestring with specific args
 
@@ -195,6 +192,9 @@ def add_kml_track(
     timestamp_list: List[str],
     style: simplekml.styleselector.Style,
     track_label: str = '',
+    heading_tilt_roll_list: Optional[List[Tuple[float, float, float]]] = None,
+    collada_model_link: Optional[str] = None,
+    model_scale: float = 1,
 ) -> simplekml.featgeom.Folder:
     """Add a simplekml GxTrack object to existing KML folder.
     
@@ -206,6 +206,11 @@ def add_kml_track(
         timestamp_list: list of timestamps (in KML format)
         style: simplekml GxTrack style
         track_label: string label for GxTrack
+        heading_tilt_roll_list: optional list of 3-length tuples indicating
+            heading, tilt, and roll (degrees) for each point in GxTrack
+        collada_model_link: optional path or URL to COLLADA file (.dae)
+            containing model to animate along GxTrack
+        model_scale: scale of the model along all axes
 
     Returns
         kml_folder: simplekml folder with newly added GxTrack object
@@ -213,6 +218,13 @@ def add_kml_track(
     track = kml_folder.newgxtrack(name=track_label)
     track.newwhen(timestamp_list)
     track.newgxcoord(lon_lat_alt_list)
+    if heading_tilt_roll_list is not None:
+        track.newgxangle(heading_tilt_roll_list)
+    if collada_model_link is not None:
+        track.model = simplekml.Model(
+            link=simplekml.Link(href=collada_model_link),
+            scale=simplekml.Scale(model_scale, model_scale, model_scale),
+        )
     track.style = style
     track.altitudemode = simplekml.AltitudeMode.relativetoground
     return kml_folder
@@ -254,14 +266,15 @@ def add_kml_model(
     Returns
         kml_folder: simplekml folder with newly added Model object
     """
-    model = kml_folder.newmodel(name=model_label)
-    model.location = simplekml.Location(lon_deg, lat_deg, alt_meters)
-    model.orientation = simplekml.Orientation(heading_deg, tilt_deg, roll_deg)
-    model.scale = simplekml.Scale(x_scale, y_scale, z_scale)
-    model.link = simplekml.Link(href=collada_model_link)
-    model.timespan.begin = timespan_begin
-    model.timespan.end = timespan_end
-    model.altitudemode = simplekml.AltitudeMode.relativetoground
+    kml_folder.newmodel(
+        name=model_label,
+        location=simplekml.Location(lon_deg, lat_deg, alt_meters),
+        orientation=simplekml.Orientation(heading_deg, tilt_deg, roll_deg),
+        scale=simplekml.Scale(x_scale, y_scale, z_scale),
+        link=simplekml.Link(href=collada_model_link),
+        timespan=simplekml.TimeSpan(begin=timespan_begin, end=timespan_end),
+        altitudemode=simplekml.AltitudeMode.relativetoground,
+    )
     return kml_folder
 
 def create_kml_polygon():